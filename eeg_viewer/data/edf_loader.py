@@ -6,6 +6,9 @@ import mne
 
 from .channel_map import OLD_TO_NEW_CHANNEL_NAMES, STANDARD_1020_CHANNELS
 
+# Device prefix on EEG channel labels, e.g. "EEG Fp1" or "EEG-Fp1"
+_EEG_PREFIX_RE = re.compile(r"^EEG[\s\-]*")
+
 
 class EDFLoader:
     """Loads and manages EDF/EDF+ file data."""
@@ -20,6 +23,7 @@ class EDFLoader:
         self.n_channels = 0
         self.n_eeg_channels = 0
         self._eeg_info = None
+        self._ch_index = {}
 
     def load(self, file_path):
         """Load an EDF file, rename channels, set montage.
@@ -33,24 +37,17 @@ class EDFLoader:
         self.file_path = file_path
         self.raw = mne.io.read_raw_edf(file_path, preload=True, verbose=False)
 
-        # Strip EEG prefix from channel names
+        # Strip EEG prefix from channel names and rename old 10-20
+        # nomenclature to new, applied in a single rename pass
         rename_map = {}
         for ch in self.raw.ch_names:
-            new_name = re.sub(r"^EEG[\s\-]*", "", ch).strip()
+            new_name = _EEG_PREFIX_RE.sub("", ch).strip()
+            new_name = OLD_TO_NEW_CHANNEL_NAMES.get(new_name, new_name)
             if new_name != ch:
                 rename_map[ch] = new_name
         if rename_map:
             self.raw.rename_channels(rename_map)
 
-        # Rename old 10-20 nomenclature to new
-        rename_old = {
-            old: new
-            for old, new in OLD_TO_NEW_CHANNEL_NAMES.items()
-            if old in self.raw.ch_names
-        }
-        if rename_old:
-            self.raw.rename_channels(rename_old)
-
         # Set ECG/EKG channel types if present
         ecg_channels = [ch for ch in self.raw.ch_names if ch.upper() in ("ECG", "EKG")]
         if ecg_channels:
@@ -77,6 +74,7 @@ class EDFLoader:
         self.sfreq = self.raw.info["sfreq"]
         self.duration = self.raw.times[-1]
         self.n_channels = len(self.channel_names)
+        self._ch_index = {ch: i for i, ch in enumerate(self.channel_names)}
 
         # Identify EEG-only channels
         eeg_picks = mne.pick_types(self.raw.info, eeg=True, ecg=False)
@@ -86,60 +84,93 @@ class EDFLoader:
         # Pre-compute EEG-only Info for topomaps
         self._eeg_info = mne.pick_info(self.raw.info, eeg_picks)
 
-    def get_data_chunk(self, start_sec, duration_sec, channels=None):
-        """Return (data, times) for a time window.
+    def get_data_chunk(self, start_sec, duration_sec, channels=None, return_times=False):
+        """Return data for a time window.
 
         Args:
             start_sec: Start time in seconds.
             duration_sec: Duration in seconds.
             channels: List of channel names, or None for all.
+            return_times: Also return the matching time vector.
 
         Returns:
-            Tuple of (data, times) where data shape is (n_channels, n_samples).
+            Data of shape (n_channels, n_samples), or (data, times) if
+            return_times is True.
         """
         start_sample = int(start_sec * self.sfreq)
         stop_sample = int((start_sec + duration_sec) * self.sfreq)
         stop_sample = min(stop_sample, self.raw.n_times)
+        return self._read(channels, start_sample, stop_sample, return_times)
 
-        picks = channels if channels else None
-        data, times = self.raw.get_data(
-            picks=picks, start=start_sample, stop=stop_sample, return_times=True
-        )
-        return data, times
-
-    def get_all_data(self, channels=None):
+    def get_all_data(self, channels=None, return_times=False):
         """Return full recording data.
 
         Args:
             channels: List of channel names, or None for all.
+            return_times: Also return the matching time vector.
 
         Returns:
-            Tuple of (data, times).
+            Data array, or (data, times) if return_times is True.
         """
-        picks = channels if channels else None
-        data, times = self.raw.get_data(picks=picks, return_times=True)
-        return data, times
+        return self._read(channels, 0, self.raw.n_times, return_times)
 
-    def get_data_range(self, channels=None, start_sec=None, end_sec=None):
+    def get_data_range(self, channels=None, start_sec=None, end_sec=None, return_times=False):
         """Return data for a specific time range.
 
         Args:
             channels: List of channel names, or None for all.
             start_sec: Start time in seconds (None = beginning).
             end_sec: End time in seconds (None = end of recording).
+            return_times: Also return the matching time vector.
 
         Returns:
-            Tuple of (data, times).
+            Data array, or (data, times) if return_times is True.
         """
-        picks = channels if channels else None
         start_sample = int(start_sec * self.sfreq) if start_sec else 0
         stop_sample = int(end_sec * self.sfreq) if end_sec else self.raw.n_times
         stop_sample = min(stop_sample, self.raw.n_times)
-        data, times = self.raw.get_data(
-            picks=picks, start=start_sample, stop=stop_sample, return_times=True
-        )
+        return self._read(channels, start_sample, stop_sample, return_times)
+
+    def _read(self, channels, start_sample, stop_sample, return_times=False):
+        """Read samples straight from the preloaded data array.
+
+        Bypasses raw.get_data(), which copies on every call. A contiguous run
+        of channels is returned as a read-only view; other selections are
+        gathered with a single fancy index. Times are only synthesized when
+        requested. A Raw that is not preloaded is read through get_data().
+
+        Returns:
+            Data array, or (data, times) if return_times is True.
+        """
+        if not self.raw.preload:
+            data = self.raw.get_data(
+                picks=channels or None, start=start_sample, stop=stop_sample,
+            )
+        else:
+            data = self._read_preloaded(channels, start_sample, stop_sample)
+        if not return_times:
+            return data
+        times = np.arange(start_sample, stop_sample, dtype=np.float64) / self.sfreq
         return data, times
 
+    def _read_preloaded(self, channels, start_sample, stop_sample):
+        """Slice the samples out of the preloaded Raw's data array."""
+        # raw._data is MNE's private in-memory array (n_channels, n_times),
+        # which only exists once the Raw is preloaded; read_raw_edf() is
+        # called with preload=True in load()
+        data = self.raw._data
+        if channels:
+            idx = [self._ch_index[ch] for ch in channels]
+            if idx == list(range(idx[0], idx[0] + len(idx))):
+                data = data[idx[0]:idx[-1] + 1, start_sample:stop_sample]
+                data.flags.writeable = False
+            else:
+                data = data[idx, start_sample:stop_sample]
+        else:
+            data = data[:, start_sample:stop_sample]
+            data.flags.writeable = False
+        return data
+
     def get_eeg_channels(self):
         """Return list of EEG-only channel names (excludes ECG)."""
         return list(self.eeg_channel_names)
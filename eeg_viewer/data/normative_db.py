@@ -19,6 +19,26 @@ NORMATIVE_RELATIVE_POWER = {
 }
 
 
+def _zscore_within(values):
+    """Within-subject Z-scores along the last axis.
+
+    Accepts a single (n_channels,) vector or an (n_bands, n_channels) stack,
+    so every band can be scored in one vectorized call. Rows with no spread
+    map to zeros.
+
+    Mean and sample std (ddof=1) come from a single sum / sum-of-squares
+    pass, accumulated in float64 to avoid cancellation.
+    """
+    n = values.shape[-1]
+    total = np.sum(values, axis=-1, keepdims=True, dtype=np.float64)
+    total_sq = np.einsum("...i,...i->...", values, values, dtype=np.float64)[..., None]
+    mean = total / n
+    std = np.sqrt(np.maximum(total_sq - total * mean, 0.0) / (n - 1))
+    flat = std < 1e-10
+    zscores = np.where(flat, 0.0, (values - mean) / np.where(flat, 1.0, std))
+    return zscores.astype(np.result_type(values.dtype, np.float32), copy=False)
+
+
 class NormativeDB:
     """Provides Z-score computation for topographic maps."""
 
@@ -60,6 +80,23 @@ class NormativeDB:
                 raise ValueError("band_name required for normative Z-score method")
             return self.compute_zscore_normative(channel_values, band_name)
 
+    def compute_zscores_by_band(self, band_values):
+        """Compute Z-scores for several bands at once.
+
+        Args:
+            band_values: Dict mapping band name -> array of shape (n_channels,).
+
+        Returns:
+            Dict mapping band name -> Z-score array of shape (n_channels,).
+        """
+        if self._method != "within":
+            return {
+                band_name: self.compute_zscore_normative(values, band_name)
+                for band_name, values in band_values.items()
+            }
+        zscores = _zscore_within(np.stack(list(band_values.values())))
+        return dict(zip(band_values, zscores))
+
     @staticmethod
     def compute_zscore_within_subject(channel_values):
         """Z-score each channel relative to the mean/std across all channels.
@@ -68,11 +105,7 @@ class NormativeDB:
 
         This highlights which brain regions deviate from the subject's own average.
         """
-        mean = np.mean(channel_values)
-        std = np.std(channel_values, ddof=1)
-        if std < 1e-10:
-            return np.zeros_like(channel_values)
-        return (channel_values - mean) / std
+        return _zscore_within(np.asarray(channel_values))
 
     @staticmethod
     def compute_zscore_normative(channel_values, band_name):
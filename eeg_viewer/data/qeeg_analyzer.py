@@ -25,16 +25,20 @@ class QEEGAnalyzer:
         # EEG channel info
         self.eeg_channels = loader.get_eeg_channels()
         self.n_eeg = len(self.eeg_channels)
+        self._ch_index = {ch: i for i, ch in enumerate(self.eeg_channels)}
 
         # Results
         self.freqs = None
-        self.psd = None          # (n_eeg, n_freqs) in V^2/Hz
+        self.psd = None          # (n_eeg, n_freqs) in V^2/Hz, float32
         self.band_powers = {}    # band_name -> (n_eeg,)
         self.relative_powers = {}  # band_name -> (n_eeg,)
+        self.relative_powers_matrix = None  # (n_eeg, n_bands) in FREQ_BANDS order
         self.zscores = {}        # band_name -> (n_eeg,)
-        self.coherence = {}      # band_name -> (n_eeg, n_eeg)
+        self.coherence_mat = None  # (n_bands, n_eeg, n_eeg), float32
         self.asymmetry = {}      # band_name -> list of ((left, right), value)
         self.peak_freqs = {}     # channel_name -> {"alpha_peak": float, "dominant": float}
+        self.alpha_peaks = None  # (n_eeg,) in Hz, eeg_channels order
+        self.dominant_freqs = None  # (n_eeg,) in Hz, eeg_channels order
 
         # Artifact rejection stats
         self.artifact_stats = {}  # populated after rejection
@@ -42,12 +46,26 @@ class QEEGAnalyzer:
         # Channel quality assessment
         self.channel_quality = {}  # channel_name -> 'good' or 'poor'
 
+        # Working data buffers (released once artifact rejection is done)
+        self._raw_data = None
+        self._filtered_data = None
+
         # Clean data cache (for coherence which needs time-domain data)
         self._clean_data = None
 
         # Progress callback (set by worker)
         self._progress_callback = None
 
+    @property
+    def coherence(self):
+        """Coherence matrices keyed by band name (views into coherence_mat)."""
+        if self.coherence_mat is None:
+            return {}
+        return {
+            band_name: self.coherence_mat[band_idx]
+            for band_idx, band_name in enumerate(FREQ_BANDS)
+        }
+
     def _get_eeg_data(self):
         """Fetch EEG data, respecting the selected time range."""
         if self.time_range:
@@ -55,6 +73,12 @@ class QEEGAnalyzer:
             return self.loader.get_data_range(self.eeg_channels, start_sec, end_sec)
         return self.loader.get_all_data(self.eeg_channels)
 
+    def _get_raw_data(self):
+        """Return the EEG data fetched for this run, fetching it if needed."""
+        if self._raw_data is None:
+            self._raw_data = self._get_eeg_data()
+        return self._raw_data
+
     def set_progress_callback(self, callback):
         self._progress_callback = callback
 
@@ -64,6 +88,9 @@ class QEEGAnalyzer:
 
     def run_full_analysis(self):
         """Run all analyses sequentially."""
+        # Fetch the EEG data once and share it across the preprocessing stages
+        self._raw_data = self._get_eeg_data()
+
         self._report_progress(2, "Detecting high-impedance channels...")
         self._detect_channel_quality()
 
@@ -73,6 +100,10 @@ class QEEGAnalyzer:
         self._report_progress(6, "Rejecting artifacts...")
         self._reject_artifacts()
 
+        # Only the clean data is needed from here on
+        self._raw_data = None
+        self._filtered_data = None
+
         self._report_progress(10, "Computing power spectral density...")
         self._compute_psd()
 
@@ -84,6 +115,9 @@ class QEEGAnalyzer:
 
         self._report_progress(45, "Computing coherence...")
         self._compute_coherence()
+        # Nothing else needs the time-domain data; finished analyzers can be
+        # kept around for reuse without holding on to it
+        self._clean_data = None
 
         self._report_progress(85, "Computing asymmetry...")
         self._compute_asymmetry()
@@ -95,12 +129,12 @@ class QEEGAnalyzer:
 
     def _detect_channel_quality(self):
         """Detect high-impedance channels using spectral and statistical analysis."""
-        data, _ = self._get_eeg_data()
+        data = self._get_raw_data()
         self.channel_quality = self.processor.detect_impedance_issues(data, self.eeg_channels)
 
     def _apply_channel_filtering(self):
         """Apply adaptive channel-specific filtering based on impedance assessment."""
-        data, _ = self._get_eeg_data()
+        data = self._get_raw_data()
         # Store filtered data but keep original for artifact rejection
         self._filtered_data = self.processor.apply_adaptive_filtering(data, self.eeg_channels)
 
@@ -116,10 +150,10 @@ class QEEGAnalyzer:
         high-impedance channels.
         """
         # Use filtered data for artifact rejection (reduces false positives on noisy channels)
-        if hasattr(self, '_filtered_data'):
+        if self._filtered_data is not None:
             data = self._filtered_data
         else:
-            data, _ = self._get_eeg_data()
+            data = self._get_raw_data()
 
         self._clean_data = self.processor.reject_artifacts(data)
 
@@ -135,26 +169,31 @@ class QEEGAnalyzer:
         }
 
     def _compute_psd(self):
-        """Compute PSD on artifact-free data."""
-        self.freqs, self.psd = self.processor.compute_psd_welch(self._clean_data)
+        """Compute PSD on artifact-free data.
+
+        The PSD is only averaged, integrated and searched for peaks, so it is
+        kept in float32; band powers, Z-scores and asymmetry inherit that dtype.
+        It is stored C-contiguous as (n_eeg, n_freqs) so per-channel band
+        integration walks each row with unit stride.
+        """
+        self.freqs, psd = self.processor.compute_psd_welch(self._clean_data)
+        self.psd = np.ascontiguousarray(psd, dtype=np.float32)
 
     def _compute_band_powers(self):
         """Compute absolute and relative power for each frequency band."""
-        for band_name, band_range in FREQ_BANDS.items():
-            self.band_powers[band_name] = self.processor.compute_band_power(
-                self.psd, self.freqs, band_range
-            )
-            self.relative_powers[band_name] = self.processor.compute_relative_power(
-                self.psd, self.freqs, band_range
-            )
+        band_powers, relative_powers = self.processor.compute_all_band_powers(self.psd, self.freqs)
+        for band_name in FREQ_BANDS:
+            self.band_powers[band_name] = band_powers[band_name].astype(np.float32)
+            self.relative_powers[band_name] = relative_powers[band_name].astype(np.float32)
+        self.relative_powers_matrix = np.column_stack(
+            [self.relative_powers[band_name] for band_name in FREQ_BANDS]
+        )
 
     def _compute_zscores(self):
-        """Compute Z-scores for topomaps."""
-        for band_name in FREQ_BANDS:
-            rel_power = self.relative_powers[band_name]
-            self.zscores[band_name] = self.normative.compute_zscores(
-                rel_power, band_name=band_name
-            )
+        """Compute Z-scores for topomaps (all bands in one call)."""
+        self.zscores = self.normative.compute_zscores_by_band(
+            {band_name: self.relative_powers[band_name] for band_name in FREQ_BANDS}
+        )
 
     def recompute_zscores(self):
         """Recompute Z-scores only (for when method changes)."""
@@ -163,82 +202,68 @@ class QEEGAnalyzer:
     def _compute_coherence(self):
         """Compute coherence between all channel pairs per band.
 
-        Uses artifact-free data for coherence computation.
+        Uses artifact-free data for coherence computation. Cross-spectra are
+        accumulated once, up to the highest band edge, and shared by every band.
         """
-        data = self._clean_data
-
-        # Pre-compute coherence for all pairs
-        n = self.n_eeg
-        coh_spectra = {}
-        total_pairs = n * (n - 1) // 2
-        done = 0
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                f, Cxy = self.processor.compute_coherence(data[i], data[j])
-                coh_spectra[(i, j)] = Cxy
-                done += 1
-                if done % 20 == 0:
-                    pct = 45 + int(40 * done / total_pairs)
-                    self._report_progress(pct, f"Computing coherence ({done}/{total_pairs})...")
-
-        # Average coherence within each band
-        for band_name, (f_low, f_high) in FREQ_BANDS.items():
-            band_mask = (f >= f_low) & (f <= f_high)
-            matrix = np.eye(n)  # diagonal = 1.0
-            for i in range(n):
-                for j in range(i + 1, n):
-                    Cxy = coh_spectra[(i, j)]
-                    mean_coh = np.mean(Cxy[band_mask])
-                    matrix[i, j] = mean_coh
-                    matrix[j, i] = mean_coh
-            self.coherence[band_name] = matrix
+        f_max = max(f_high for _, f_high in FREQ_BANDS.values())
+        f, Pxy, n_segments = self.processor.compute_cross_spectra(self._clean_data, f_max=f_max)
+
+        n_bands = len(FREQ_BANDS)
+        self.coherence_mat = np.empty((n_bands, self.n_eeg, self.n_eeg), dtype=np.float32)
+        if n_segments < 2:
+            # A single segment is trivially coherent with itself at every bin
+            self.coherence_mat.fill(1.0)
+            self._report_progress(85, "Computing coherence...")
+            return
+
+        for band_idx, (band_name, band_range) in enumerate(FREQ_BANDS.items()):
+            self.coherence_mat[band_idx] = self.processor.compute_band_coherence(
+                f, Pxy, band_range
+            )
+            pct = 45 + int(40 * (band_idx + 1) / n_bands)
+            self._report_progress(pct, f"Computing coherence ({band_name})...")
 
     def _compute_asymmetry(self):
         """Compute hemispheric asymmetry: ln(Right) - ln(Left) for homologous pairs."""
-        for band_name in FREQ_BANDS:
-            pairs_values = []
-            for left_ch, right_ch in ASYMMETRY_PAIRS:
-                if left_ch in self.eeg_channels and right_ch in self.eeg_channels:
-                    left_idx = self.eeg_channels.index(left_ch)
-                    right_idx = self.eeg_channels.index(right_ch)
-                    left_power = self.band_powers[band_name][left_idx]
-                    right_power = self.band_powers[band_name][right_idx]
-                    # Avoid log(0)
-                    left_power = max(left_power, 1e-20)
-                    right_power = max(right_power, 1e-20)
-                    asym = np.log(right_power) - np.log(left_power)
-                    pairs_values.append(((left_ch, right_ch), float(asym)))
-            self.asymmetry[band_name] = pairs_values
+        valid_pairs = [
+            (left_ch, right_ch)
+            for left_ch, right_ch in ASYMMETRY_PAIRS
+            if left_ch in self._ch_index and right_ch in self._ch_index
+        ]
+        left_idx = np.array([self._ch_index[left] for left, _ in valid_pairs], dtype=int)
+        right_idx = np.array([self._ch_index[right] for _, right in valid_pairs], dtype=int)
+
+        # (n_bands, n_eeg) log-power table, floored to avoid log(0)
+        log_powers = np.stack([self.band_powers[band] for band in FREQ_BANDS])
+        np.maximum(log_powers, 1e-20, out=log_powers)
+        np.log(log_powers, out=log_powers)
+        asym = log_powers[:, right_idx] - log_powers[:, left_idx]
+
+        for band_idx, band_name in enumerate(FREQ_BANDS):
+            self.asymmetry[band_name] = [
+                (pair, float(value)) for pair, value in zip(valid_pairs, asym[band_idx])
+            ]
 
     def _compute_peak_frequencies(self):
         """Find peak frequency per channel: alpha peak and overall dominant frequency."""
-        alpha_low, alpha_high = FREQ_BANDS["Alpha"]
-        total_low, total_high = TOTAL_POWER_RANGE
-        alpha_mask = (self.freqs >= alpha_low) & (self.freqs <= alpha_high)
-        total_mask = (self.freqs >= total_low) & (self.freqs <= total_high)
-
-        for i, ch in enumerate(self.eeg_channels):
-            ch_psd = self.psd[i]
-
-            # Alpha peak frequency
-            if np.any(alpha_mask) and np.any(ch_psd[alpha_mask] > 0):
-                alpha_idx = np.argmax(ch_psd[alpha_mask])
-                alpha_peak = self.freqs[alpha_mask][alpha_idx]
-            else:
-                alpha_peak = 0.0
-
-            # Dominant frequency (overall)
-            if np.any(total_mask) and np.any(ch_psd[total_mask] > 0):
-                dom_idx = np.argmax(ch_psd[total_mask])
-                dominant = self.freqs[total_mask][dom_idx]
-            else:
-                dominant = 0.0
-
-            self.peak_freqs[ch] = {
-                "alpha_peak": float(alpha_peak),
-                "dominant": float(dominant),
-            }
+        self.alpha_peaks = self._peak_in_band(FREQ_BANDS["Alpha"])
+        self.dominant_freqs = self._peak_in_band(TOTAL_POWER_RANGE)
+
+        self.peak_freqs = {
+            ch: {"alpha_peak": float(alpha), "dominant": float(dom)}
+            for ch, alpha, dom in zip(
+                self.eeg_channels, self.alpha_peaks.tolist(), self.dominant_freqs.tolist()
+            )
+        }
+
+    def _peak_in_band(self, band):
+        """Return the frequency of maximum PSD within band for every channel (0 if none)."""
+        band_bins = self.processor.band_slice(self.freqs, band)
+        if band_bins.start == band_bins.stop:
+            return np.zeros(self.n_eeg)
+        band_psd = self.psd[:, band_bins]
+        peaks = self.freqs[band_bins][np.argmax(band_psd, axis=1)]
+        return np.where(np.max(band_psd, axis=1) > 0, peaks, 0.0)
 
     def get_region_spectra(self, region):
         """Return averaged amplitude spectrum for a brain region.
@@ -250,7 +275,7 @@ class QEEGAnalyzer:
             Tuple of (freqs, mean_amplitude_spectrum).
         """
         channels = REGION_MAP.get(region, [])
-        indices = [self.eeg_channels.index(ch) for ch in channels if ch in self.eeg_channels]
+        indices = [self._ch_index[ch] for ch in channels if ch in self._ch_index]
         if not indices:
             return self.freqs, np.zeros(len(self.freqs))
 
@@ -278,36 +303,22 @@ class QEEGAnalyzer:
                 writer.writerow([])
 
             # Band powers
-            writer.writerow(["=== Band Powers (Absolute) ==="])
-            writer.writerow(["Channel"] + list(FREQ_BANDS.keys()))
-            for i, ch in enumerate(self.eeg_channels):
-                row = [ch]
-                for band in FREQ_BANDS:
-                    row.append(f"{self.band_powers[band][i]:.6e}")
-                writer.writerow(row)
-
+            self._write_band_table(
+                f, writer, "=== Band Powers (Absolute) ===", self.band_powers, "%.6e"
+            )
             writer.writerow([])
 
             # Relative powers
-            writer.writerow(["=== Relative Powers ==="])
-            writer.writerow(["Channel"] + list(FREQ_BANDS.keys()))
-            for i, ch in enumerate(self.eeg_channels):
-                row = [ch]
-                for band in FREQ_BANDS:
-                    row.append(f"{self.relative_powers[band][i]:.4f}")
-                writer.writerow(row)
-
+            self._write_band_table(
+                f, writer, "=== Relative Powers ===", self.relative_powers, "%.4f"
+            )
             writer.writerow([])
 
             # Z-scores
-            writer.writerow([f"=== Z-Scores ({self.normative.get_method_label()}) ==="])
-            writer.writerow(["Channel"] + list(FREQ_BANDS.keys()))
-            for i, ch in enumerate(self.eeg_channels):
-                row = [ch]
-                for band in FREQ_BANDS:
-                    row.append(f"{self.zscores[band][i]:.3f}")
-                writer.writerow(row)
-
+            self._write_band_table(
+                f, writer, f"=== Z-Scores ({self.normative.get_method_label()}) ===",
+                self.zscores, "%.3f",
+            )
             writer.writerow([])
 
             # Asymmetry
@@ -336,3 +347,18 @@ class QEEGAnalyzer:
                     f"{pf.get('alpha_peak', 0):.2f}",
                     f"{pf.get('dominant', 0):.2f}",
                 ])
+
+    def _write_band_table(self, f, writer, title, values, fmt):
+        """Write a channel x band numeric block with one np.savetxt call.
+
+        Rows match csv.writer output (comma-delimited, CRLF line endings).
+        """
+        writer.writerow([title])
+        writer.writerow(["Channel"] + list(FREQ_BANDS.keys()))
+        table = np.column_stack(
+            [np.array(self.eeg_channels, dtype=object)] + [values[band] for band in FREQ_BANDS]
+        )
+        np.savetxt(
+            f, table, fmt=["%s"] + [fmt] * len(FREQ_BANDS),
+            delimiter=",", newline="\r\n",
+        )
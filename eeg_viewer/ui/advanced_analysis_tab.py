@@ -1,9 +1,6 @@
 """Advanced Analysis Tab - Spectrogram and temporal band power analysis."""
 
 import numpy as np
-from scipy.signal import spectrogram as scipy_spectrogram
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QScrollArea, QFrame, QGroupBox,
 )
@@ -19,6 +16,7 @@ class SpectrogramWidget(QWidget):
         super().__init__(parent)
         self._analyzer = None
         self._loader = None
+        self._spectrograms = {}  # channel -> (f, t, Sxx_db, vmin, vmax), filled on first view
         self._init_ui()
 
     def _init_ui(self):
@@ -34,7 +32,9 @@ class SpectrogramWidget(QWidget):
         selector.addStretch()
         layout.addLayout(selector)
 
-        # Matplotlib figure
+        # Matplotlib figure (imported on first construction to keep startup light)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
         self._figure = Figure(figsize=(12, 6), dpi=100)
         self._figure.set_facecolor("white")
         self._canvas = FigureCanvasQTAgg(self._figure)
@@ -44,12 +44,12 @@ class SpectrogramWidget(QWidget):
         """Update spectrogram with analyzer data."""
         self._analyzer = analyzer
         self._loader = loader
+        self._spectrograms = {}
 
         # Populate channel selector
         self._channel_combo.blockSignals(True)
         self._channel_combo.clear()
-        for ch in analyzer.eeg_channels:
-            self._channel_combo.addItem(ch)
+        self._channel_combo.addItems(list(analyzer.eeg_channels))
         self._channel_combo.blockSignals(False)
 
         # Draw first channel
@@ -61,21 +61,26 @@ class SpectrogramWidget(QWidget):
         if self._analyzer and channel:
             self._plot_spectrogram(channel)
 
-    def _plot_spectrogram(self, channel_name):
-        """Plot spectrogram for selected channel using STFT."""
-        if not self._analyzer or not self._loader:
-            return
+    def _get_spectrogram(self, channel_name):
+        """Return the spectrogram of a channel, computing it on first use.
 
-        # Get raw data for this channel
-        channel_idx = self._analyzer.eeg_channels.index(channel_name)
-        data, times = self._loader.get_all_data([channel_name])
-        signal = data[0]
+        Color limits are taken from the full spectrum, then only the
+        displayed 0-30 Hz rows (plus one above, so the shading reaches the
+        top edge) are kept, so switching back to a channel is a pure redraw.
+        """
+        cached = self._spectrograms.get(channel_name)
+        if cached is not None:
+            return cached
+
+        from scipy.signal import spectrogram as scipy_spectrogram
+
+        signal = self._loader.get_all_data([channel_name])[0]
 
         # Compute spectrogram using short-time Fourier transform
         # nperseg = 256 gives ~2 Hz resolution at 500 Hz sampling rate
         # noverlap = 128 gives good temporal resolution
         f, t, Sxx = scipy_spectrogram(
-            signal,
+            signal.astype(np.float32),
             fs=self._loader.sfreq,
             window='hann',
             nperseg=256,
@@ -83,19 +88,37 @@ class SpectrogramWidget(QWidget):
             scaling='density'
         )
 
-        # Convert power to dB scale for visualization
-        Sxx_db = 10 * np.log10(Sxx + 1e-20)
+        # Convert power to dB scale for visualization (in place)
+        Sxx += 1e-20
+        np.log10(Sxx, out=Sxx)
+        Sxx *= 10
+
+        vmin, vmax = np.percentile(Sxx, [5, 95])
+        n_keep = min(len(f), np.searchsorted(f, 30, side='right') + 1)
+        cached = (f[:n_keep], t, np.ascontiguousarray(Sxx[:n_keep]), vmin, vmax)
+        self._spectrograms[channel_name] = cached
+        return cached
+
+    def _plot_spectrogram(self, channel_name):
+        """Plot the spectrogram for the selected channel."""
+        if not self._analyzer or not self._loader:
+            return
+
+        f, t, Sxx_db, vmin, vmax = self._get_spectrogram(channel_name)
 
         self._figure.clear()
         ax = self._figure.add_subplot(111)
 
         # Plot spectrogram
-        im = ax.pcolormesh(
-            t, f, Sxx_db,
-            shading='gouraud',
+        im = ax.imshow(
+            Sxx_db,
+            extent=[t[0], t[-1], f[0], f[-1]],
+            origin='lower',
+            aspect='auto',
+            interpolation='bilinear',
             cmap='viridis',
-            vmin=np.percentile(Sxx_db, 5),
-            vmax=np.percentile(Sxx_db, 95)
+            vmin=vmin,
+            vmax=vmax
         )
 
         # Overlay frequency band boundaries
@@ -137,46 +160,65 @@ class BandPowerEvolutionWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._analyzer = None
+        self._bar_groups = None  # one BarContainer per band
+        self._channels = None
         self._init_ui()
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
         self._figure = Figure(figsize=(12, 6), dpi=100)
         self._figure.set_facecolor("white")
         self._canvas = FigureCanvasQTAgg(self._figure)
         layout.addWidget(self._canvas)
 
+        # Axes persist across redraws; bars are updated in place
+        self._ax = self._figure.add_subplot(111)
+
     def plot_band_evolution(self, analyzer):
         """Plot relative band power per channel as grouped bars."""
         self._analyzer = analyzer
 
-        self._figure.clear()
-        ax = self._figure.add_subplot(111)
-
-        # Prepare data: channels x bands
+        # Relative powers: channels x bands
         channels = analyzer.eeg_channels
         bands = list(FREQ_BANDS.keys())
-        n_channels = len(channels)
-        n_bands = len(bands)
+        data = analyzer.relative_powers_matrix
 
-        # Get relative powers
-        data = np.zeros((n_channels, n_bands))
-        for band_idx, band_name in enumerate(bands):
-            data[:, band_idx] = analyzer.relative_powers[band_name]
+        if channels != self._channels:
+            self._create_bars(channels, bands, data)
+        else:
+            for band_idx, bars in enumerate(self._bar_groups):
+                for rect, value in zip(bars, data[:, band_idx]):
+                    rect.set_height(value)
+            self._ax.relim()
+            self._ax.autoscale_view()
+
+        self._canvas.draw_idle()
+
+    def _create_bars(self, channels, bands, data):
+        """Build the grouped bar chart from scratch (only when the channels change)."""
+        ax = self._ax
+        ax.clear()
+
+        n_bands = len(bands)
 
         # Create grouped bar chart
-        x = np.arange(n_channels)
+        x = np.arange(len(channels))
         width = 0.2
         colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
 
+        self._bar_groups = []
         for band_idx, band_name in enumerate(bands):
             offset = (band_idx - n_bands/2 + 0.5) * width
-            ax.bar(
+            bars = ax.bar(
                 x + offset, data[:, band_idx],
                 width, label=band_name, color=colors[band_idx], alpha=0.8
             )
+            self._bar_groups.append(bars)
+        self._channels = list(channels)
 
         ax.set_xlabel('Channel', fontsize=11, fontweight='bold')
         ax.set_ylabel('Relative Power', fontsize=11, fontweight='bold')
@@ -187,7 +229,6 @@ class BandPowerEvolutionWidget(QWidget):
         ax.grid(True, axis='y', alpha=0.3)
 
         self._figure.tight_layout()
-        self._canvas.draw()
 
 
 class AdvancedAnalysisTab(QWidget):
@@ -1,8 +1,6 @@
 """Hemispheric asymmetry bar chart display."""
 
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
 
 from ..utils.constants import FREQ_BANDS
@@ -14,6 +12,9 @@ class AsymmetryWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._analyzer = None
+        self._per_band = {}  # band_name -> (labels, values)
+        self._bars = None
+        self._bar_labels = None
         self._init_ui()
 
     def _init_ui(self):
@@ -24,22 +25,36 @@ class AsymmetryWidget(QWidget):
         selector = QHBoxLayout()
         selector.addWidget(QLabel("Band:"))
         self._band_combo = QComboBox()
-        for band_name in FREQ_BANDS:
-            self._band_combo.addItem(band_name)
+        self._band_combo.addItems(list(FREQ_BANDS))
         self._band_combo.currentTextChanged.connect(self._on_band_changed)
         selector.addWidget(self._band_combo)
         selector.addStretch()
         layout.addLayout(selector)
 
-        # Matplotlib figure
+        # Matplotlib figure (imported on first construction to keep startup light)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
         self._figure = Figure(figsize=(5, 4), dpi=100)
         self._figure.set_facecolor("white")
         self._canvas = FigureCanvasQTAgg(self._figure)
         layout.addWidget(self._canvas)
 
+        # Axes persist across redraws; bars are updated in place
+        self._ax = self._figure.add_subplot(111)
+
     def plot_asymmetry(self, analyzer):
         """Plot asymmetry bars for the selected band."""
         self._analyzer = analyzer
+
+        # Labels and values only change with the analyzer, so unpack them once
+        self._per_band = {}
+        for band_name, pairs_values in analyzer.asymmetry.items():
+            labels = [f"{left}-{right}" for (left, right), _ in pairs_values]
+            values = np.fromiter(
+                (v for _, v in pairs_values), dtype=float, count=len(pairs_values)
+            )
+            self._per_band[band_name] = (labels, values)
+
         self._draw()
 
     def _on_band_changed(self, band_name):
@@ -48,22 +63,35 @@ class AsymmetryWidget(QWidget):
 
     def _draw(self):
         band_name = self._band_combo.currentText()
-        if not band_name or band_name not in self._analyzer.asymmetry:
+        if not band_name or band_name not in self._per_band:
             return
 
-        pairs_values = self._analyzer.asymmetry[band_name]
-        if not pairs_values:
+        labels, values = self._per_band[band_name]
+        if not labels:
             return
 
-        labels = [f"{left}-{right}" for (left, right), _ in pairs_values]
-        values = [v for _, v in pairs_values]
         colors = ["#CC4444" if v > 0 else "#4444CC" for v in values]
 
-        self._figure.clear()
-        ax = self._figure.add_subplot(111)
+        if labels != self._bar_labels:
+            self._create_bars(band_name, labels, values, colors)
+        else:
+            for rect, value, color in zip(self._bars, values, colors):
+                rect.set_width(value)
+                rect.set_facecolor(color)
+            self._ax.relim()
+            self._ax.autoscale_view()
+            self._ax.set_title(f"Asymmetry: {band_name}", fontsize=11, fontweight="bold")
+
+        self._canvas.draw_idle()
+
+    def _create_bars(self, band_name, labels, values, colors):
+        """Build the bar chart from scratch (only when the channel pairs change)."""
+        ax = self._ax
+        ax.clear()
 
         y_pos = np.arange(len(labels))
-        ax.barh(y_pos, values, color=colors, height=0.6)
+        self._bars = ax.barh(y_pos, values, color=colors, height=0.6)
+        self._bar_labels = labels
         ax.set_yticks(y_pos)
         ax.set_yticklabels(labels, fontsize=9)
         ax.axvline(0, color="black", linewidth=0.8)
@@ -80,4 +108,3 @@ class AsymmetryWidget(QWidget):
 
         ax.grid(True, axis="x", alpha=0.3)
         self._figure.tight_layout()
-        self._canvas.draw()
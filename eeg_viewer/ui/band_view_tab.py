@@ -7,17 +7,16 @@ spectrogram and static/playback modes.
 """
 
 import numpy as np
-from scipy.signal import spectrogram as scipy_spectrogram
 import pyqtgraph as pg
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QLabel, QComboBox,
     QPushButton, QSlider, QRadioButton, QButtonGroup, QGroupBox, QFrame,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QTransform
 
 from ..data.signal_processor import SignalProcessor
+from ..workers.band_worker import BandComputeWorker
 from ..workers.playback_worker import PlaybackWorker
 from ..utils.constants import (
     FREQ_BANDS, DEFAULT_WINDOW_SEC, DEFAULT_SPEED, MIN_SPEED, MAX_SPEED,
@@ -35,6 +34,9 @@ BAND_TRACE_COLORS = {
 # Spacing between band traces in µV (GFP peaks at ~10-40 µV)
 BAND_SPACING_UV = 50.0
 
+# Highest frequency shown in the spectrogram (Hz)
+SPECTROGRAM_F_MAX = 30.0
+
 
 class BandViewTab(QWidget):
     """Band-filtered waveform viewer with spectrogram."""
@@ -44,15 +46,33 @@ class BandViewTab(QWidget):
         self._loader = None
         self._processor = None
         self._band_data = {}       # band_name -> (times, averaged_filtered_uV)
+        self._gfp = None           # (n_bands, n_samples) GFP in µV, float32
+        self._times = None
         self._plot_items = {}
         self._amplitude_scale = 1.0
         self._time_window = DEFAULT_WINDOW_SEC
         self._current_time = 0.0
         self._mode = "static"
         self._spectrogram_data = None  # (t, f, Sxx_db)
+        self._thread = None
+        self._worker = None
+        self._spec_im = None           # AxesImage of the spectrogram
+        self._spec_step = 1            # Time decimation of the drawn spectrogram
+        self._band_names = tuple(FREQ_BANDS)
+        # Unscaled vertical offset of each band trace, top to bottom
+        self._base_offsets = -BAND_SPACING_UV * np.arange(len(self._band_names))
+        self._tick_scale = None        # Amplitude scale the y-axis ticks were built for
+        self._traces_scale = None      # Amplitude scale of the curves' transforms
         self._init_ui()
         self._init_playback()
 
+        # Slider drags fire far more often than the screen refreshes; redraws
+        # are coalesced to at most one per frame
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(int(1000 / TARGET_FPS))
+        self._redraw_timer.timeout.connect(self._on_redraw_timeout)
+
     def _init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -67,7 +87,14 @@ class BandViewTab(QWidget):
 
         wf_label = QLabel("Band Power — Global Field Power (GFP)")
         wf_label.setStyleSheet("font-weight: bold; font-size: 14px; padding: 4px;")
-        waveform_layout.addWidget(wf_label)
+        wf_header = QHBoxLayout()
+        wf_header.addWidget(wf_label)
+        wf_header.addStretch()
+        self._status_label = QLabel()
+        self._status_label.setStyleSheet("font-size: 13px; color: #666; padding: 4px;")
+        self._status_label.setVisible(False)
+        wf_header.addWidget(self._status_label)
+        waveform_layout.addLayout(wf_header)
 
         self._plot_widget = pg.PlotWidget()
         self._plot_widget.setLabel("bottom", "Time", units="s")
@@ -75,6 +102,10 @@ class BandViewTab(QWidget):
         self._plot_widget.setMouseEnabled(x=True, y=False)
         self._plot_widget.getAxis("left").setWidth(60)
         self._plot_widget.setBackground("w")
+        # Curves are decimated to the view width (keeping peaks) and clipped to
+        # the visible range, so full-length traces can be handed over
+        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        self._plot_widget.setClipToView(True)
         waveform_layout.addWidget(self._plot_widget)
 
         splitter.addWidget(waveform_container)
@@ -91,6 +122,8 @@ class BandViewTab(QWidget):
         spec_header.addStretch()
         spec_layout.addLayout(spec_header)
 
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
         self._spec_figure = Figure(figsize=(12, 4), dpi=100)
         self._spec_figure.set_facecolor("white")
         self._spec_canvas = FigureCanvasQTAgg(self._spec_figure)
@@ -192,38 +225,58 @@ class BandViewTab(QWidget):
         self._playback.set_duration(loader.duration)
         self._update_time_label(0.0)
 
-        # Get all EEG data
-        eeg_channels = loader.get_eeg_channels()
-        data, times = loader.get_all_data(eeg_channels)
-
-        # Bandpass filter and compute GFP (std across channels) for each band.
-        # Simple averaging cancels out because of average-referencing, so we use
-        # Global Field Power = std across channels, which measures activation.
+        # Drop the previous recording's traces while the new ones are computed
         self._band_data = {}
-        for band_name, (f_low, f_high) in FREQ_BANDS.items():
-            filtered = self._processor.bandpass_filter(data, f_low, f_high)
-            # GFP: standard deviation across channels at each time point (µV)
-            gfp_trace = np.std(filtered, axis=0) * 1e6
-            self._band_data[band_name] = (times, gfp_trace)
-
-        # Compute spectrogram on GFP signal (std across channels, not mean)
-        gfp_signal = np.std(data, axis=0)
-        f, t, Sxx = scipy_spectrogram(
-            gfp_signal, fs=loader.sfreq,
-            window='hann', nperseg=256, noverlap=192, scaling='density',
-        )
-        Sxx_db = 10 * np.log10(Sxx + 1e-20)
-        self._spectrogram_data = (t, f, Sxx_db)
+        self._spectrogram_data = None
+        self._plot_widget.clear()
+        self._plot_items.clear()
+        self._status_label.setText("Computing band waveforms...")
+        self._status_label.setVisible(True)
+
+        # Filtering and the spectrogram run in a background thread (or come
+        # from the on-disk cache) so the UI stays responsive while loading
+        self._thread = QThread(self)
+        self._worker = BandComputeWorker(loader, self._processor, SPECTROGRAM_F_MAX)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.finished.connect(self._on_band_ready)
+        self._worker.error.connect(self._on_band_error)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.error.connect(self._thread.quit)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def _on_band_ready(self, arrays):
+        """Populate the plots from the worker's results."""
+        # A newer recording may have been opened while this one was computing
+        if self.sender() is not self._worker:
+            return
+        self._status_label.setVisible(False)
+
+        self._gfp = np.ascontiguousarray(arrays["gfp"])
+        self._times = np.arange(self._gfp.shape[1]) / self._loader.sfreq
+        self._band_data = {
+            band_name: (self._times, self._gfp[band_idx])
+            for band_idx, band_name in enumerate(self._band_names)
+        }
+        self._spectrogram_data = (arrays["spec_t"], arrays["spec_f"], arrays["spec_db"])
 
         # Create plot items
         self._create_plot_items()
         self._plot_spectrogram()
         self._update_display()
 
+    def _on_band_error(self, message):
+        if self.sender() is not self._worker:
+            return
+        self._status_label.setText(f"Band computation failed: {message}")
+
     def _create_plot_items(self):
         """Create PyQtGraph traces for each band."""
         self._plot_widget.clear()
         self._plot_items.clear()
+        self._tick_scale = None
+        self._traces_scale = None
 
         # Remove old legend if any
         if self._plot_widget.plotItem.legend is not None:
@@ -234,24 +287,25 @@ class BandViewTab(QWidget):
 
         legend = self._plot_widget.addLegend(offset=(10, 10))
 
-        bands = list(FREQ_BANDS.keys())
-        for i, band_name in enumerate(bands):
+        for i, band_name in enumerate(self._band_names):
             color = BAND_TRACE_COLORS.get(band_name, "#333333")
             pen = pg.mkPen(color=color, width=1.5)
-            item = self._plot_widget.plot([], [], pen=pen, name=band_name)
+            item = self._plot_widget.plot(
+                self._times, self._gfp[i], pen=pen, name=band_name,
+                skipFiniteCheck=True,
+            )
             self._plot_items[band_name] = item
 
         self._update_y_axis_labels()
 
     def _update_y_axis_labels(self):
         """Set Y-axis labels for each band at its offset."""
-        bands = list(FREQ_BANDS.keys())
-        ticks = []
-        for i, band_name in enumerate(bands):
-            offset = -i * BAND_SPACING_UV * self._amplitude_scale
-            ticks.append((offset, band_name))
-        y_axis = self._plot_widget.getAxis("left")
-        y_axis.setTicks([ticks])
+        if self._amplitude_scale == self._tick_scale:
+            return
+        offsets = (self._base_offsets * self._amplitude_scale).tolist()
+        ticks = list(zip(offsets, self._band_names))
+        self._plot_widget.getAxis("left").setTicks([ticks])
+        self._tick_scale = self._amplitude_scale
 
     def _update_display(self):
         """Refresh waveform display."""
@@ -264,56 +318,42 @@ class BandViewTab(QWidget):
 
     def _draw_static(self):
         """Draw full recording for static view."""
-        bands = list(FREQ_BANDS.keys())
-        max_points = 50000
-
-        for i, band_name in enumerate(bands):
-            times, trace = self._band_data[band_name]
-            offset = -i * BAND_SPACING_UV * self._amplitude_scale
-
-            # Downsample for performance
-            if len(trace) > max_points:
-                step = len(trace) // max_points
-                t_ds = times[::step]
-                y_ds = trace[::step]
-            else:
-                t_ds = times
-                y_ds = trace
-
-            scaled = y_ds * self._amplitude_scale + offset
-            self._plot_items[band_name].setData(t_ds, scaled)
-
+        self._update_traces()
         self._plot_widget.setXRange(0, self._loader.duration, padding=0.01)
         self._update_y_range()
 
     def _draw_windowed(self):
         """Draw time window for playback."""
-        bands = list(FREQ_BANDS.keys())
+        if not self._band_data:
+            return
         start = max(0, self._current_time)
         end = min(start + self._time_window, self._loader.duration)
         if end <= start:
             return
 
-        for i, band_name in enumerate(bands):
-            times, trace = self._band_data[band_name]
-            offset = -i * BAND_SPACING_UV * self._amplitude_scale
-
-            # Find sample indices for the window
-            start_idx = int(start * self._loader.sfreq)
-            end_idx = int(end * self._loader.sfreq)
-            end_idx = min(end_idx, len(trace))
-
-            t_win = times[start_idx:end_idx]
-            y_win = trace[start_idx:end_idx]
-            scaled = y_win * self._amplitude_scale + offset
-            self._plot_items[band_name].setData(t_win, scaled)
-
+        # The curves clip to the view, so moving the window is just a range change
+        self._update_traces()
         self._plot_widget.setXRange(start, start + self._time_window, padding=0)
         self._update_y_range()
 
+    def _update_traces(self):
+        """Apply the amplitude scale and band offsets to the curves.
+
+        The curves hold the unscaled GFP traces; scale and offset are applied
+        as an item transform, so an amplitude change touches no sample data.
+        """
+        if self._amplitude_scale == self._traces_scale:
+            return
+        offsets = (self._base_offsets * self._amplitude_scale).tolist()
+        for band_name, offset in zip(self._band_names, offsets):
+            self._plot_items[band_name].setTransform(
+                QTransform(1, 0, 0, self._amplitude_scale, 0, offset)
+            )
+        self._traces_scale = self._amplitude_scale
+
     def _update_y_range(self):
         """Fit Y range to visible bands."""
-        n = len(FREQ_BANDS)
+        n = len(self._band_names)
         top = BAND_SPACING_UV * self._amplitude_scale
         bottom = -(n) * BAND_SPACING_UV * self._amplitude_scale
         self._plot_widget.setYRange(bottom, top, padding=0.05)
@@ -328,12 +368,16 @@ class BandViewTab(QWidget):
         self._spec_figure.clear()
         ax = self._spec_figure.add_subplot(111)
 
-        im = ax.pcolormesh(
-            t, f, Sxx_db,
-            shading='gouraud', cmap='viridis',
-            vmin=np.percentile(Sxx_db, 5),
-            vmax=np.percentile(Sxx_db, 95),
+        # Both color limits from a single partition pass over the full data,
+        # so they do not shift when the decimation changes with the width
+        vmin, vmax = np.percentile(Sxx_db, [5, 95])
+
+        im = ax.imshow(
+            Sxx_db[:, :1], origin='lower', aspect='auto', interpolation='bilinear',
+            cmap='viridis', vmin=vmin, vmax=vmax,
         )
+        self._spec_im = im
+        self._set_spectrogram_image()
 
         # Band boundary lines
         for boundary in [1, 4, 8, 13, 25]:
@@ -342,7 +386,7 @@ class BandViewTab(QWidget):
 
         ax.set_xlabel('Time (s)', fontsize=10)
         ax.set_ylabel('Frequency (Hz)', fontsize=10)
-        ax.set_ylim([0, 30])
+        ax.set_ylim([0, SPECTROGRAM_F_MAX])
         ax.set_title('Global Field Power Spectrogram', fontsize=11, fontweight='bold')
 
         self._spec_figure.colorbar(im, ax=ax, label='Power (dB/Hz)')
@@ -357,6 +401,31 @@ class BandViewTab(QWidget):
         self._spec_figure.tight_layout()
         self._spec_canvas.draw()
 
+    def _set_spectrogram_image(self):
+        """Load the spectrogram, decimated to the canvas width, into the image."""
+        t, f, Sxx_db = self._spectrogram_data
+        # Long recordings have far more columns than the canvas has pixels;
+        # draw about two columns per pixel and keep the full data for resizes
+        self._spec_step = self._spectrogram_step()
+        t_ds = t[::self._spec_step]
+        self._spec_im.set_data(Sxx_db[:, ::self._spec_step])
+        self._spec_im.set_extent([t_ds[0], t_ds[-1], f[0], f[-1]])
+
+    def _spectrogram_step(self):
+        """Return the column stride that fits the spectrogram to the canvas."""
+        n_cols = self._spectrogram_data[2].shape[1]
+        width_px = max(1, self._spec_canvas.width())
+        return max(1, n_cols // (2 * width_px))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Swap the image data only when the width change alters the decimation;
+        # the canvas repaints itself after a resize, so no rebuild is needed
+        if (self._spectrogram_data is not None
+                and self._spectrogram_step() != self._spec_step):
+            self._set_spectrogram_image()
+            self._spec_canvas.draw_idle()
+
     def _update_time_label(self, current_sec):
         duration = self._loader.duration if self._loader else 0
         cur_m, cur_s = divmod(int(current_sec), 60)
@@ -396,11 +465,18 @@ class BandViewTab(QWidget):
         self._playback.seek(time_sec)
         self._update_time_label(time_sec)
         if self._mode == "playback":
-            self._draw_windowed()
+            self._schedule_redraw()
 
     def _on_amp_changed(self, value):
         self._amplitude_scale = value / 100.0
         self._amp_label.setText(f"Scale: {self._amplitude_scale:.1f}x")
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _on_redraw_timeout(self):
         self._update_y_axis_labels()
         self._update_display()
 
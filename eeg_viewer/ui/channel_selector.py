@@ -1,19 +1,29 @@
-"""Channel selection panel with checkboxes for each EEG channel."""
+"""Channel selection panel with a checkable list of EEG channels."""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QCheckBox, QPushButton, QLabel, QScrollArea, QFrame,
+    QWidget, QVBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem, QFrame,
 )
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+
+# Checkbox toggles within this many ms are coalesced into one emit
+EMIT_DEBOUNCE_MS = 50
 
 
 class ChannelSelector(QWidget):
-    """Left panel with checkboxes for each EEG/ECG channel."""
+    """Left panel with a checkable row for each EEG/ECG channel."""
 
     channels_changed = pyqtSignal(list)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._checkboxes = {}
+        self._names = []
+
+        # Rapid toggling would otherwise make every listener replot per click
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_selection)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -41,53 +51,58 @@ class ChannelSelector(QWidget):
         line.setFrameShadow(QFrame.Sunken)
         layout.addWidget(line)
 
-        # Scrollable checkbox area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        self._checkbox_container = QWidget()
-        self._checkbox_layout = QVBoxLayout(self._checkbox_container)
-        self._checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        self._checkbox_layout.setSpacing(2)
-        scroll.setWidget(self._checkbox_container)
-        layout.addWidget(scroll)
+        # Checkable list; rows are lightweight model items rather than one
+        # widget per channel, so large montages populate without a relayout
+        self._list = QListWidget()
+        self._list.setFrameShape(QFrame.NoFrame)
+        self._list.setSelectionMode(QListWidget.NoSelection)
+        self._list.setUniformItemSizes(True)
+        self._list.itemChanged.connect(self._on_item_changed)
+        layout.addWidget(self._list)
 
         self.setFixedWidth(140)
 
     def set_channels(self, channel_names):
-        """Populate checkboxes from channel list. All checked by default."""
-        # Clear existing
-        for cb in self._checkboxes.values():
-            self._checkbox_layout.removeWidget(cb)
-            cb.deleteLater()
-        self._checkboxes.clear()
-
-        for name in channel_names:
-            cb = QCheckBox(name)
-            cb.setChecked(True)
-            cb.stateChanged.connect(self._on_checkbox_changed)
-            self._checkbox_layout.addWidget(cb)
-            self._checkboxes[name] = cb
-
-        self._checkbox_layout.addStretch()
+        """Populate the list from channel names. All checked by default."""
+        self._names = list(channel_names)
+        self._list.blockSignals(True)
+        self._list.clear()
+        for name in self._names:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self._list.addItem(item)
+        self._list.blockSignals(False)
 
     def get_selected(self):
         """Return list of checked channel names in order."""
-        return [name for name, cb in self._checkboxes.items() if cb.isChecked()]
+        return [
+            name for row, name in enumerate(self._names)
+            if self._list.item(row).checkState() == Qt.Checked
+        ]
 
     def _select_all(self):
-        for cb in self._checkboxes.values():
-            cb.blockSignals(True)
-            cb.setChecked(True)
-            cb.blockSignals(False)
-        self.channels_changed.emit(self.get_selected())
+        self._set_all_checked(True)
+        self._emit_now(list(self._names))
 
     def _select_none(self):
-        for cb in self._checkboxes.values():
-            cb.blockSignals(True)
-            cb.setChecked(False)
-            cb.blockSignals(False)
+        self._set_all_checked(False)
+        self._emit_now([])
+
+    def _set_all_checked(self, checked):
+        state = Qt.Checked if checked else Qt.Unchecked
+        self._list.blockSignals(True)
+        for row in range(self._list.count()):
+            self._list.item(row).setCheckState(state)
+        self._list.blockSignals(False)
+
+    def _emit_now(self, selected):
+        # Supersedes any pending debounced emit
+        self._emit_timer.stop()
+        self.channels_changed.emit(selected)
+
+    def _emit_selection(self):
         self.channels_changed.emit(self.get_selected())
 
-    def _on_checkbox_changed(self, state):
-        self.channels_changed.emit(self.get_selected())
+    def _on_item_changed(self, item):
+        self._emit_timer.start()
@@ -1,8 +1,6 @@
 """Coherence heatmap matrix display."""
 
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
 
 from ..utils.constants import FREQ_BANDS
@@ -14,6 +12,9 @@ class CoherenceWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._analyzer = None
+        self._ax = None
+        self._im = None
+        self._channels = None
         self._init_ui()
 
     def _init_ui(self):
@@ -24,14 +25,15 @@ class CoherenceWidget(QWidget):
         selector = QHBoxLayout()
         selector.addWidget(QLabel("Band:"))
         self._band_combo = QComboBox()
-        for band_name in FREQ_BANDS:
-            self._band_combo.addItem(band_name)
+        self._band_combo.addItems(list(FREQ_BANDS))
         self._band_combo.currentTextChanged.connect(self._on_band_changed)
         selector.addWidget(self._band_combo)
         selector.addStretch()
         layout.addLayout(selector)
 
         # Matplotlib figure
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
         self._figure = Figure(figsize=(5, 4.5), dpi=100)
         self._figure.set_facecolor("white")
         self._canvas = FigureCanvasQTAgg(self._figure)
@@ -52,8 +54,20 @@ class CoherenceWidget(QWidget):
             return
 
         matrix = self._analyzer.coherence[band_name]
-        channels = self._analyzer.eeg_channels
-
+        channels = list(self._analyzer.eeg_channels)
+
+        # The axes, tick labels and colorbar only depend on the channel list;
+        # a band change just swaps the image data
+        if channels != self._channels:
+            self._create_image(band_name, channels, matrix)
+            self._canvas.draw()
+        else:
+            self._im.set_data(matrix)
+            self._ax.set_title(f"Coherence: {band_name}", fontsize=11, fontweight="bold")
+            self._canvas.draw_idle()
+
+    def _create_image(self, band_name, channels, matrix):
+        """Build the heatmap from scratch (only when the channels change)."""
         self._figure.clear()
         ax = self._figure.add_subplot(111)
 
@@ -73,4 +87,6 @@ class CoherenceWidget(QWidget):
         ax.set_title(f"Coherence: {band_name}", fontsize=11, fontweight="bold")
 
         self._figure.tight_layout()
-        self._canvas.draw()
+        self._ax = ax
+        self._im = im
+        self._channels = channels
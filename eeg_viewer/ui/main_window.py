@@ -4,7 +4,7 @@ from PyQt5.QtWidgets import (
     QMainWindow, QTabWidget, QFileDialog, QStatusBar, QAction, QMessageBox,
     QToolBar, QPushButton, QWidget, QVBoxLayout,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
 from .waveform_tab import WaveformTab
@@ -127,10 +127,15 @@ class MainWindow(QMainWindow):
             f"{dur_m:02d}:{dur_s:02d} duration"
         )
 
-        # Pass data to tabs
-        self._waveform_tab.set_data(self._loader)
-        self._band_view_tab.set_data(self._loader)
-        self._qeeg_tab.set_data(self._loader)
+        # Pass data to tabs. The visible one is filled right away; the others
+        # are queued behind the next event loop pass so it paints first
+        data_tabs = [self._waveform_tab, self._band_view_tab, self._qeeg_tab]
+        current = self._tabs.currentWidget()
+        for tab in data_tabs:
+            if tab is current:
+                tab.set_data(self._loader)
+            else:
+                QTimer.singleShot(0, lambda tab=tab: tab.set_data(self._loader))
 
     def _show_about(self):
         QMessageBox.about(
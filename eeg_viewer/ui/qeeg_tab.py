@@ -1,19 +1,72 @@
 """Tab 2: qEEG analysis dashboard."""
 
+from collections import OrderedDict
+
+import numpy as np
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
-    QPushButton, QProgressBar, QScrollArea, QGridLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QGroupBox, QSplitter, QFrame,
-    QDoubleSpinBox, QCheckBox,
+    QPushButton, QProgressBar, QScrollArea, QGridLayout, QTableView,
+    QHeaderView, QGroupBox, QSplitter, QFrame, QDoubleSpinBox, QCheckBox,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThreadPool, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
 
 from .spectra_widget import SpectraWidget
 from .topomap_widget import TopomapWidget
 from ..data.signal_processor import SignalProcessor
 from ..data.normative_db import NormativeDB
 from ..data.qeeg_analyzer import QEEGAnalyzer
-from ..workers.analysis_worker import AnalysisWorker
+from ..workers.analysis_worker import AnalysisRunnable
+
+# Finished analyses kept per recording, keyed by time range, so switching
+# back to a recently analyzed range does not recompute it
+ANALYSIS_CACHE_SIZE = 4
+
+# Progress reports arriving faster than this are coalesced into one repaint
+PROGRESS_UPDATE_MS = 33
+
+
+class PeakFreqModel(QAbstractTableModel):
+    """Read-only table model of per-channel peak alpha and dominant frequencies.
+
+    Cells are formatted on demand in data(), so filling the table costs one
+    model reset instead of three item objects per channel.
+    """
+
+    HEADERS = ["Channel", "Peak Alpha (Hz)", "Dominant Freq (Hz)"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._channels = []
+        self._alpha = np.zeros(0)
+        self._dom = np.zeros(0)
+
+    def set_peaks(self, channels, alpha, dominant):
+        """Replace the table contents (channel names and two frequency arrays)."""
+        self.beginResetModel()
+        self._channels = list(channels)
+        self._alpha = np.asarray(alpha, dtype=float)
+        self._dom = np.asarray(dominant, dtype=float)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._channels)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return self._channels[row]
+        values = self._alpha if col == 1 else self._dom
+        return f"{values[row]:.2f}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class QEEGTab(QWidget):
@@ -26,8 +79,14 @@ class QEEGTab(QWidget):
         super().__init__(parent)
         self._loader = None
         self._analyzer = None
-        self._worker = None
-        self._thread = None
+        self._analysis_cache = OrderedDict()  # time_range -> QEEGAnalyzer
+
+        self._pending_progress = None  # latest (percent, message) not yet shown
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_UPDATE_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -142,8 +201,11 @@ class QEEGTab(QWidget):
         peak_group.setMinimumHeight(250)
         peak_layout = QVBoxLayout(peak_group)
         peak_layout.setContentsMargins(4, 12, 4, 4)
-        self._peak_table = QTableWidget()
+        self._peak_model = PeakFreqModel(self)
+        self._peak_table = QTableView()
+        self._peak_table.setModel(self._peak_model)
         self._peak_table.setMaximumHeight(300)  # Increased from 200 to allow larger table
+        self._peak_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         peak_layout.addWidget(self._peak_table)
         self._content_layout.addWidget(peak_group)
 
@@ -163,6 +225,7 @@ class QEEGTab(QWidget):
         self._end_spin.setValue(duration)
         self._update_range_label()
 
+        self._analysis_cache.clear()
         self._run_analysis()
 
     def _get_time_range(self):
@@ -179,31 +242,48 @@ class QEEGTab(QWidget):
         self._status_label.setText("Computing qEEG analysis...")
         self._status_label.setStyleSheet("font-size: 13px; color: #666;")
         self._progress_bar.setVisible(True)
+        self._progress_timer.stop()
+        self._pending_progress = None
         self._progress_bar.setValue(0)
         self._reanalyze_btn.setEnabled(False)
+        method = self._zscore_combo.currentData()
+
+        # A cached analysis only needs its Z-scores redone for the current method
+        cached = self._analysis_cache.get(time_range)
+        if cached is not None:
+            if cached.normative.method != method:
+                cached.normative.set_method(method)
+                cached.recompute_zscores()
+            self._analyzer = cached
+            self._on_analysis_complete(cached)
+            return
 
         # Create analyzer with time range
         processor = SignalProcessor(self._loader.sfreq)
         normative = NormativeDB()
-        method = self._zscore_combo.currentData()
         normative.set_method(method)
 
         self._analyzer = QEEGAnalyzer(
             self._loader, processor, normative, time_range=time_range
         )
 
-        # Run in background thread
-        self._thread = QThread()
-        self._worker = AnalysisWorker(self._analyzer)
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self._on_progress)
-        self._worker.finished.connect(self._on_analysis_complete)
-        self._worker.error.connect(self._on_analysis_error)
-        self._worker.finished.connect(self._thread.quit)
-        self._thread.start()
+        # Run on a pooled background thread
+        runnable = AnalysisRunnable(self._analyzer)
+        runnable.signals.progress.connect(self._on_progress)
+        runnable.signals.finished.connect(self._on_analysis_complete)
+        runnable.signals.error.connect(self._on_analysis_error)
+        QThreadPool.globalInstance().start(runnable)
 
     def _on_progress(self, percent, message):
+        self._pending_progress = (percent, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        if self._pending_progress is None:
+            return
+        percent, message = self._pending_progress
+        self._pending_progress = None
         self._progress_bar.setValue(percent)
         self._progress_bar.setFormat(f"{message} ({percent}%)")
 
@@ -234,7 +314,14 @@ class QEEGTab(QWidget):
         time_range = self._get_time_range()
         self._run_analysis(time_range=time_range)
 
-    def _on_analysis_complete(self):
+    def _on_analysis_complete(self, analyzer):
+        if analyzer is not self._analyzer:
+            return  # Superseded by a newer run
+
+        self._analysis_cache[analyzer.time_range] = analyzer
+        self._analysis_cache.move_to_end(analyzer.time_range)
+        while len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
         self._progress_bar.setVisible(False)
         self._zscore_combo.setEnabled(True)
         self._export_btn.setEnabled(True)
@@ -284,6 +371,8 @@ class QEEGTab(QWidget):
         if self._analyzer is None:
             return
         method = self._zscore_combo.currentData()
+        if method == self._analyzer.normative.method:
+            return
         self._analyzer.normative.set_method(method)
         self._analyzer.recompute_zscores()
         eeg_info = self._loader.get_eeg_info()
@@ -295,23 +384,11 @@ class QEEGTab(QWidget):
         if self._analyzer is None:
             return
 
-        peak_freqs = self._analyzer.peak_freqs
-        channels = list(peak_freqs.keys())
-
-        self._peak_table.setColumnCount(3)
-        self._peak_table.setHorizontalHeaderLabels(
-            ["Channel", "Peak Alpha (Hz)", "Dominant Freq (Hz)"]
+        self._peak_model.set_peaks(
+            self._analyzer.eeg_channels,
+            self._analyzer.alpha_peaks,
+            self._analyzer.dominant_freqs,
         )
-        self._peak_table.setRowCount(len(channels))
-
-        for row, ch in enumerate(channels):
-            self._peak_table.setItem(row, 0, QTableWidgetItem(ch))
-            alpha_peak = peak_freqs[ch].get("alpha_peak", 0)
-            dominant = peak_freqs[ch].get("dominant", 0)
-            self._peak_table.setItem(row, 1, QTableWidgetItem(f"{alpha_peak:.2f}"))
-            self._peak_table.setItem(row, 2, QTableWidgetItem(f"{dominant:.2f}"))
-
-        self._peak_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
     def _on_export(self):
         from .export_dialog import ExportDialog
@@ -9,10 +9,13 @@ Matches the NeuroSynchrony PDF report layout:
 - Region labels on the left
 """
 
+import math
+
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+import pyqtgraph as pg
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
 
 from ..utils.constants import FREQ_BANDS
 
@@ -31,7 +34,7 @@ _BAND_SHADING = {
 
 _GRID_LINE_COLOR = "#CCDDEE"     # Very light for 1 Hz gridlines
 _BAND_BOUNDARY_COLOR = "#AACCDD" # Slightly darker for band boundary lines
-_HGRID_COLOR = "#DDDDDD"         # Horizontal gridlines
+_HGRID_ALPHA = 0.15              # Light horizontal gridlines at the y ticks
 
 
 class SpectraWidget(QWidget):
@@ -41,60 +44,108 @@ class SpectraWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._figure = Figure(figsize=(10, 8), dpi=100)
-        self._figure.set_facecolor("white")
-        self._canvas = FigureCanvasQTAgg(self._figure)
+        self._glw = pg.GraphicsLayoutWidget()
+        self._glw.setBackground("w")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._canvas)
+        layout.addWidget(self._glw)
 
-    def plot_spectra(self, analyzer):
-        """Plot magnitude spectra for Frontal, Central, Posterior regions."""
-        self._figure.clear()
+        # Plots and decorations are identical for every analysis, so they are
+        # built once; plot_spectra only updates the curves and y-scaling
+        self._plots = []
+        self._curves = []
+        self._gridlines = []
+        self._init_plots()
+
+    def _init_plots(self):
+        """Build the three region plots with their static band decorations."""
+        grid_pen = pg.mkPen(_with_alpha(_GRID_LINE_COLOR, 0.6), width=1)
+        boundary_pen = pg.mkPen(_BAND_BOUNDARY_COLOR, width=1, style=Qt.DashLine)
 
         for idx, region in enumerate(self.REGIONS):
-            ax = self._figure.add_subplot(3, 1, idx + 1)
-            freqs, amplitude = analyzer.get_region_spectra(region)
+            # ---- Region label on the left ----
+            self._glw.addLabel(region, row=idx, col=0, size="12pt", bold=True)
 
-            # Display range 1-25 Hz (matching PDF)
-            mask = (freqs >= 1) & (freqs <= 25)
-            freqs_display = freqs[mask]
-            amp_display = amplitude[mask]
+            plot = self._glw.addPlot(row=idx, col=1)
+            plot.setMouseEnabled(x=False, y=False)
+            plot.setMenuEnabled(False)
+            plot.hideButtons()
 
             # ---- Band shading (colored tints for each frequency band) ----
-            for band_name, band_info in _BAND_SHADING.items():
-                f_low, f_high = band_info["range"]
-                ax.axvspan(f_low, f_high, color=band_info["color"],
-                           alpha=0.85, zorder=0)
+            for band_info in _BAND_SHADING.values():
+                region_item = pg.LinearRegionItem(
+                    values=band_info["range"],
+                    brush=_with_alpha(band_info["color"], 0.85),
+                    pen=pg.mkPen(None),
+                    movable=False,
+                )
+                region_item.setZValue(-10)
+                plot.addItem(region_item)
 
             # ---- Light vertical gridlines at every 1 Hz ----
-            for hz in range(1, 26):
-                ax.axvline(hz, color=_GRID_LINE_COLOR, linewidth=0.4,
-                           linestyle="-", zorder=1, alpha=0.6)
+            # One item of disconnected segments; plot_spectra sets their height
+            gridlines = pg.PlotCurveItem(pen=grid_pen, connect="pairs")
+            plot.addItem(gridlines)
 
             # ---- Dashed lines at band boundaries (4, 8, 13 Hz) ----
             for boundary_hz in [4, 8, 13]:
-                ax.axvline(
-                    boundary_hz, color=_BAND_BOUNDARY_COLOR,
-                    linewidth=0.9, linestyle="--", zorder=2,
-                )
+                plot.addItem(pg.InfiniteLine(pos=boundary_hz, angle=90, pen=boundary_pen))
+
+            # ---- Horizontal gridlines at the y ticks ----
+            plot.showGrid(x=False, y=True, alpha=_HGRID_ALPHA)
+
+            # ---- Spectrum line (blue, matching PDF), filled in by plot_spectra ----
+            curve = plot.plot(pen=pg.mkPen(_SPECTRUM_LINE_COLOR, width=1.5))
+            curve.setZValue(5)
+
+            # ---- X-axis: only show label on bottom plot ----
+            plot.setXRange(1, 25, padding=0)
+            bottom = plot.getAxis("bottom")
+            bottom.setTicks([[(hz, str(hz)) for hz in [5, 10, 15, 20, 25]]])
+            if idx == 2:
+                plot.setLabel("bottom", "Frequency (Hz)")
+            else:
+                bottom.setStyle(showValues=False)
 
+            # Fixed width keeps the three plots aligned whatever the y labels
+            plot.getAxis("left").setWidth(60)
+
+            self._plots.append(plot)
+            self._curves.append(curve)
+            self._gridlines.append(gridlines)
+
+    def plot_spectra(self, analyzer):
+        """Plot magnitude spectra for Frontal, Central, Posterior regions."""
+        # Display range 1-25 Hz (matching PDF), as a slice so the displayed
+        # arrays are views; all regions share the analyzer's frequency axis
+        display = analyzer.processor.band_slice(analyzer.freqs, (1, 25))
+
+        grid_x = np.repeat(np.arange(1, 26, dtype=float), 2)
+
+        for region, plot, curve, gridlines in zip(
+            self.REGIONS, self._plots, self._curves, self._gridlines
+        ):
+            freqs, amplitude = analyzer.get_region_spectra(region)
+            freqs_display = freqs[display]
+            amp_display = amplitude[display]
             # ---- Y-axis scaling: auto-scale so spectrum fits within graph ----
             # Match the PDF style where the Y-axis label (e.g. "4.3 µV") is
             # the graph ceiling, and the spectrum line just fits below it
             if len(amp_display) > 0:
-                max_amp = np.max(amp_display)
+                # Plain floats: this is scalar arithmetic, not array work
+                max_amp = float(amp_display.max())
                 # Add 15% headroom to ensure line never clips
                 y_scale = max_amp * 1.15
                 # Round to nice value (0.5 increment)
-                y_scale = np.ceil(y_scale * 2) / 2
+                y_scale = math.ceil(y_scale * 2) / 2
                 # Absolute minimum of 0.5 µV
                 y_scale = max(y_scale, 0.5)
             else:
                 y_scale = 1.0
 
-            ax.set_ylim(0, y_scale)
+            plot.setYRange(0, y_scale, padding=0)
+            gridlines.setData(grid_x, np.tile([0.0, y_scale], 25))
 
             # ---- Horizontal gridlines at regular intervals ----
             # Choose sensible tick spacing based on y_scale
@@ -107,39 +158,16 @@ class SpectraWidget(QWidget):
             else:
                 ytick_step = 2.0
             yticks = np.arange(0, y_scale + ytick_step * 0.01, ytick_step)
-            ax.set_yticks(yticks)
-            ax.yaxis.grid(True, color=_HGRID_COLOR, linewidth=0.5,
-                          linestyle="-", zorder=0)
+            plot.getAxis("left").setTicks([[(v, f"{v:g}") for v in yticks.tolist()]])
 
-            # ---- Plot the spectrum line (blue, matching PDF) ----
-            ax.plot(
-                freqs_display, amp_display,
-                color=_SPECTRUM_LINE_COLOR, linewidth=1.5, zorder=5,
-            )
+            curve.setData(freqs_display, amp_display)
 
             # ---- Y-axis label: scale max in µV (matching PDF) ----
-            ax.set_ylabel(f"{y_scale:.1f} µV", fontsize=10, fontweight="bold")
-
-            # ---- Region label on the left ----
-            ax.text(
-                -0.10, 0.5, region,
-                transform=ax.transAxes,
-                fontsize=12, fontweight="bold",
-                va="center", ha="center",
-            )
-
-            # ---- X-axis: only show label on bottom plot ----
-            ax.set_xlim(1, 25)
-            ax.set_xticks([5, 10, 15, 20, 25])
-            if idx == 2:
-                ax.set_xlabel("Frequency (Hz)", fontsize=11)
-            else:
-                ax.set_xticklabels([])
+            plot.setLabel("left", f"{y_scale:.1f} µV", **{"font-weight": "bold"})
 
-            # Clean up spines to match PDF's minimal style
-            ax.spines["top"].set_visible(False)
-            ax.spines["right"].set_visible(False)
-            ax.tick_params(axis="both", which="both", length=3)
 
-        self._figure.tight_layout(rect=[0.08, 0.02, 1.0, 0.98])
-        self._canvas.draw()
+def _with_alpha(color, alpha):
+    """Return a QColor for a hex color string with the given opacity."""
+    qcolor = QColor(color)
+    qcolor.setAlphaF(alpha)
+    return qcolor
@@ -9,8 +9,6 @@ Matches the NeuroSynchrony PDF report colormap:
 """
 
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.colors import LinearSegmentedColormap
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 
@@ -43,6 +41,17 @@ ZSCORE_CMAP = LinearSegmentedColormap.from_list(
 )
 
 
+# Options shared by the displayed topomaps and the interpolation probes, so
+# both go through exactly the same sensor-to-grid interpolation
+_TOPOMAP_KWARGS = dict(
+    cmap=ZSCORE_CMAP,
+    vlim=(ZSCORE_VMIN, ZSCORE_VMAX),
+    show=False,
+    contours=0,
+    sensors=False,
+)
+
+
 class TopomapWidget(QWidget):
     """Four topographic head maps (Delta, Theta, Alpha, Beta) with Z-score coloring.
 
@@ -51,24 +60,65 @@ class TopomapWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # The figure and canvas are created on the first plot, so sessions
+        # that never run an analysis don't pay for them
+        self._figure = None
+        self._canvas = None
+
+        # Artists and interpolation of the current montage; see plot_topomaps()
+        self._eeg_info = None
+        self._ims = {}
+        self._interp = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def _ensure_canvas(self):
+        """Create the figure and canvas if they don't exist yet."""
+        if self._canvas is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+
         # Larger figure to make topomaps prominent (matching PDF proportions)
         self._figure = Figure(figsize=(14, 5.5), dpi=100)
         self._figure.set_facecolor("white")
         self._canvas = FigureCanvasQTAgg(self._figure)
         self._canvas.setMinimumHeight(400)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._canvas)
+        self._layout.addWidget(self._canvas)
 
     def plot_topomaps(self, analyzer, eeg_info):
         """Plot 4 topomaps (Delta, Theta, Alpha, Beta) with Z-score coloring.
 
+        The maps are built with MNE the first time a montage is shown. Later
+        calls for the same montage only replace the image data, interpolated
+        with a cached sensor-to-grid matrix.
+
         Args:
             analyzer: QEEGAnalyzer with computed Z-scores.
             eeg_info: MNE Info object with EEG channel positions only.
         """
+        self._ensure_canvas()
+        if eeg_info is not self._eeg_info or not self._ims:
+            self._create_topomaps(analyzer, eeg_info)
+            self._canvas.draw()
+            return
+
+        if self._interp is None:
+            self._interp = self._build_interpolator(eeg_info)
+        # All bands are interpolated in one matrix product: (n_pixels, n_bands)
+        zscores = np.column_stack([analyzer.zscores[band] for band in self._ims])
+        grids = self._interp @ zscores.astype(np.float64, copy=False)
+        for i, im in enumerate(self._ims.values()):
+            im.set_data(grids[:, i].reshape(im.get_array().shape))
+        self._canvas.draw_idle()
+
+    def _create_topomaps(self, analyzer, eeg_info):
+        """Build the figure from scratch (only when the montage changes)."""
         self._figure.clear()
+        self._ims = {}
+        self._interp = None
+        self._eeg_info = eeg_info
 
         band_names = list(FREQ_BANDS.keys())
 
@@ -96,15 +146,9 @@ class TopomapWidget(QWidget):
 
             # Plot topomap
             im, _ = mne.viz.plot_topomap(
-                zscores,
-                eeg_info,
-                axes=axes[i],
-                cmap=ZSCORE_CMAP,
-                vlim=(ZSCORE_VMIN, ZSCORE_VMAX),
-                show=False,
-                contours=0,
-                sensors=False,
+                zscores, eeg_info, axes=axes[i], **_TOPOMAP_KWARGS,
             )
+            self._ims[band_name] = im
 
             # Title above each topomap (matching PDF style)
             axes[i].set_title(
@@ -121,4 +165,22 @@ class TopomapWidget(QWidget):
             )
             cbar.ax.tick_params(labelsize=10)
 
-        self._canvas.draw()
+    @staticmethod
+    def _build_interpolator(eeg_info):
+        """Return the (n_grid_pixels, n_channels) sensor-to-grid matrix.
+
+        MNE's topomap interpolation is linear in the sensor values, so its
+        response to each unit vector is one column of the matrix. The probes
+        are drawn into a scratch figure that is never rendered.
+        """
+        from matplotlib.figure import Figure
+
+        n_channels = len(eeg_info.ch_names)
+        ax = Figure().add_axes([0, 0, 1, 1])
+        columns = []
+        for ch in range(n_channels):
+            unit = np.zeros(n_channels)
+            unit[ch] = 1.0
+            im, _ = mne.viz.plot_topomap(unit, eeg_info, axes=ax, **_TOPOMAP_KWARGS)
+            columns.append(np.ma.getdata(im.get_array()).ravel())
+        return np.stack(columns, axis=1)
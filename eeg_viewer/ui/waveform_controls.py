@@ -4,10 +4,11 @@ from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QSlider, QLabel,
     QComboBox, QRadioButton, QButtonGroup, QGroupBox, QCheckBox, QGridLayout,
 )
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 
 from ..utils.constants import (
     MIN_SPEED, MAX_SPEED, DEFAULT_SPEED, DEFAULT_WINDOW_SEC, WINDOW_SIZE_OPTIONS,
+    TARGET_FPS,
 )
 
 
@@ -26,6 +27,20 @@ class WaveformControls(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._duration = 0.0
+        # The label only shows whole seconds, so it is rebuilt when they change
+        self._duration_suffix = " / 00:00"
+        self._label_sec = None
+
+        # Dragging a slider changes its value far more often than the view can
+        # redraw; position and amplitude changes are coalesced to one emit per
+        # frame, carrying the latest value
+        self._pending_position = None
+        self._pending_amplitude = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(int(1000 / TARGET_FPS))
+        self._slider_timer.timeout.connect(self._emit_slider_changes)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -142,6 +157,9 @@ class WaveformControls(QWidget):
         """Set total recording duration in seconds."""
         self._duration = duration
         self._time_slider.setRange(0, int(duration * 1000))
+        tot_m, tot_s = divmod(int(duration), 60)
+        self._duration_suffix = f" / {tot_m:02d}:{tot_s:02d}"
+        self._label_sec = None
         self._update_time_label(0.0)
 
     def update_time_display(self, current_sec):
@@ -156,9 +174,12 @@ class WaveformControls(QWidget):
         self._play_btn.setText("Pause" if is_playing else "Play")
 
     def _update_time_label(self, current_sec):
-        cur_m, cur_s = divmod(int(current_sec), 60)
-        tot_m, tot_s = divmod(int(self._duration), 60)
-        self._time_label.setText(f"{cur_m:02d}:{cur_s:02d} / {tot_m:02d}:{tot_s:02d}")
+        sec = int(current_sec)
+        if sec == self._label_sec:
+            return
+        self._label_sec = sec
+        cur_m, cur_s = divmod(sec, 60)
+        self._time_label.setText(f"{cur_m:02d}:{cur_s:02d}{self._duration_suffix}")
 
     def _on_mode_changed(self, button):
         mode = "static" if button == self._static_radio else "playback"
@@ -175,12 +196,26 @@ class WaveformControls(QWidget):
     def _on_time_slider_changed(self, value):
         time_sec = value / 1000.0
         self._update_time_label(time_sec)
-        self.position_changed.emit(time_sec)
+        self._pending_position = time_sec
+        self._schedule_slider_emit()
 
     def _on_amp_slider_changed(self, value):
         scale = value / 100.0
         self._amp_label.setText(f"Scale: {scale:.1f}x")
-        self.amplitude_changed.emit(scale)
+        self._pending_amplitude = scale
+        self._schedule_slider_emit()
+
+    def _schedule_slider_emit(self):
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+
+    def _emit_slider_changes(self):
+        if self._pending_position is not None:
+            time_sec, self._pending_position = self._pending_position, None
+            self.position_changed.emit(time_sec)
+        if self._pending_amplitude is not None:
+            scale, self._pending_amplitude = self._pending_amplitude, None
+            self.amplitude_changed.emit(scale)
 
     def _on_window_combo_changed(self, index):
         window_sec = self._window_combo.itemData(index)
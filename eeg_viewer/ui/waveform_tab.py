@@ -4,6 +4,7 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSplitter
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QTransform
 
 from .channel_selector import ChannelSelector
 from .waveform_controls import WaveformControls
@@ -32,6 +33,8 @@ class WaveformTab(QWidget):
         self._current_time = 0.0
         self._mode = "static"
         self._channel_spacing = CHANNEL_SPACING_UV
+        self._traces_scale = None  # amplitude scale the curve transforms use
+        self._quant_steps = {}  # channel -> Volts per int16 code of its curve
 
         self._init_ui()
         self._init_playback()
@@ -53,6 +56,11 @@ class WaveformTab(QWidget):
         self._plot_widget.showGrid(x=True, y=True, alpha=GRID_ALPHA)
         self._plot_widget.setMouseEnabled(x=True, y=False)
         self._plot_widget.getAxis("left").setWidth(60)
+        # Curves hold the whole recording; they are decimated to the view
+        # width (keeping peaks) and clipped to the visible range, so playback
+        # only has to move the view
+        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        self._plot_widget.setClipToView(True)
         splitter.addWidget(self._plot_widget)
 
         splitter.setStretchFactor(0, 0)
@@ -113,27 +121,54 @@ class WaveformTab(QWidget):
         self._update_display()
 
     def _create_plot_items(self, channels):
-        """Create PlotDataItem for each channel."""
+        """Create a PlotDataItem holding the full recording for each channel."""
         self._plot_widget.clear()
         self._plot_items.clear()
-
-        for i, ch_name in enumerate(channels):
+        self._quant_steps = {}
+        self._sync_plot_items(channels)
+
+    def _sync_plot_items(self, channels):
+        """Match the curves to ``channels``, only loading channels not yet plotted."""
+        for ch_name in list(self._plot_items):
+            if ch_name not in channels:
+                self._plot_widget.removeItem(self._plot_items.pop(ch_name))
+                del self._quant_steps[ch_name]
+        # Lane offsets depend on the channel order, so every transform is redone
+        self._traces_scale = None
+
+        added = [ch for ch in channels if ch not in self._plot_items]
+        if added:
+            # Curves store int16 codes spanning each channel's range, a quarter
+            # of the float64 source and well past screen resolution. The step
+            # size, µV conversion, amplitude scale and channel offset are all
+            # applied by _update_traces as item transforms
+            data, times = self._loader.get_all_data(added, return_times=True)
+            peaks = np.abs(data).max(axis=1)
+            steps = np.where(peaks > 0, peaks / np.iinfo(np.int16).max, 1.0)
+            codes = np.rint(data / steps[:, None]).astype(np.int16)
+
+        for i, ch_name in enumerate(added):
             # Use a distinct red color for ECG to differentiate from EEG traces
             if self._is_ecg_channel(ch_name):
                 pen = pg.mkPen(color="#CC3333", width=1)
             else:
                 pen = pg.mkPen(color=TRACE_COLOR, width=1)
-            item = self._plot_widget.plot([], [], pen=pen, name=ch_name)
+            item = self._plot_widget.plot(
+                times, codes[i], pen=pen, name=ch_name, skipFiniteCheck=True,
+            )
             self._plot_items[ch_name] = item
+            self._quant_steps[ch_name] = steps[i]
 
         self._update_y_axis_labels()
 
+    def _channel_offsets(self):
+        """Return the vertical offset of each visible channel's lane."""
+        step = self._channel_spacing * self._amplitude_scale
+        return -step * np.arange(len(self._visible_channels))
+
     def _update_y_axis_labels(self):
         """Set Y-axis tick labels to channel names at offset positions."""
-        ticks = []
-        for i, ch_name in enumerate(self._visible_channels):
-            offset = -i * self._channel_spacing * self._amplitude_scale
-            ticks.append((offset, ch_name))
+        ticks = list(zip(self._channel_offsets().tolist(), self._visible_channels))
 
         y_axis = self._plot_widget.getAxis("left")
         y_axis.setTicks([ticks])
@@ -149,56 +184,40 @@ class WaveformTab(QWidget):
             self._draw_windowed()
 
     def _draw_static(self):
-        """Draw the full recording for static/scrollable viewing."""
-        # Hide all items first
-        for ch_name, item in self._plot_items.items():
-            if ch_name not in self._visible_channels:
-                item.setData([], [])
-
-        # Get data for visible channels
-        data, times = self._loader.get_all_data(self._visible_channels)
-
-        # Downsample for display performance if needed
-        max_points = 50000
-        if data.shape[1] > max_points:
-            step = data.shape[1] // max_points
-            data = data[:, ::step]
-            times = times[::step]
-
-        for i, ch_name in enumerate(self._visible_channels):
-            if ch_name in self._plot_items:
-                offset = -i * self._channel_spacing * self._amplitude_scale
-                ch_scale = self._channel_scale(ch_name)
-                scaled = data[i] * ch_scale * 1e6 + offset  # convert V to uV
-                self._plot_items[ch_name].setData(times, scaled)
-
+        """Show the full recording for static/scrollable viewing."""
+        self._update_traces()
         self._plot_widget.setXRange(0, self._loader.duration, padding=0.01)
         self._update_y_range()
 
     def _draw_windowed(self):
-        """Draw a time window for playback mode."""
-        # Hide all items first
-        for ch_name, item in self._plot_items.items():
-            if ch_name not in self._visible_channels:
-                item.setData([], [])
-
+        """Show a time window for playback mode."""
         start = max(0, self._current_time)
         duration = min(self._time_window, self._loader.duration - start)
         if duration <= 0:
             return
 
-        data, times = self._loader.get_data_chunk(start, duration, self._visible_channels)
-
-        for i, ch_name in enumerate(self._visible_channels):
-            if ch_name in self._plot_items:
-                offset = -i * self._channel_spacing * self._amplitude_scale
-                ch_scale = self._channel_scale(ch_name)
-                scaled = data[i] * ch_scale * 1e6 + offset  # convert V to uV
-                self._plot_items[ch_name].setData(times, scaled)
-
+        # The curves clip to the view, so moving the window is just a range change
+        self._update_traces()
         self._plot_widget.setXRange(start, start + self._time_window, padding=0)
         self._update_y_range()
 
+    def _update_traces(self):
+        """Map the int16 curve codes to µV, amplitude scale and channel offset.
+
+        Scale and offset are item transforms, so an amplitude change touches
+        no sample data.
+        """
+        if self._amplitude_scale == self._traces_scale:
+            return
+        offsets = self._channel_offsets().tolist()
+        for ch_name, offset in zip(self._visible_channels, offsets):
+            # int16 code -> V -> uV -> display units
+            ch_scale = self._quant_steps[ch_name] * 1e6 * self._channel_scale(ch_name)
+            self._plot_items[ch_name].setTransform(
+                QTransform(1, 0, 0, ch_scale, 0, offset)
+            )
+        self._traces_scale = self._amplitude_scale
+
     def _update_y_range(self):
         """Set Y range to fit all visible channels."""
         if not self._visible_channels:
@@ -246,8 +265,10 @@ class WaveformTab(QWidget):
             self._draw_windowed()
 
     def _on_channels_changed(self, channels):
+        if channels == self._visible_channels:
+            return
         self._visible_channels = channels
-        self._create_plot_items(channels)
+        self._sync_plot_items(channels)
         self._update_display()
 
     def _on_playback_tick(self, current_time):
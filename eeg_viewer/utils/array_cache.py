@@ -0,0 +1,110 @@
+"""Best-effort on-disk cache for arrays derived from a recording.
+
+Entries are .npz files in the application's own cache directory, keyed on
+the EDF file's path, size and modification time, the cache format and app
+version, and the parameters that produced them, so an edited file, changed
+settings or an upgrade never hit a stale entry. The directory is pruned
+after every write to entries younger than CACHE_MAX_AGE_DAYS and at most
+CACHE_MAX_BYTES in total, least recently used first.
+"""
+
+import hashlib
+import os
+import time
+import zipfile
+
+import numpy as np
+from PyQt5.QtCore import QStandardPaths
+
+from .. import __version__
+
+# Bump when the cached computations change so old entries are ignored
+CACHE_VERSION = 3
+
+# Bounds on the cache directory, enforced after each write
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_MAX_AGE_DAYS = 30
+
+
+def cache_path(file_path, tag, *params):
+    """Return the cache file for a recording and parameter set.
+
+    Args:
+        file_path: Path of the source recording.
+        tag: Name of the cached computation (e.g. "band_view").
+        *params: Anything else the cached result depends on (must have a
+                 stable repr).
+
+    Returns:
+        Path of the .npz file, or None if the recording cannot be stat'ed.
+    """
+    try:
+        stat = os.stat(file_path)
+    except (OSError, TypeError):
+        return None
+
+    key_source = "|".join(
+        [os.path.abspath(file_path), str(stat.st_size), str(stat.st_mtime_ns),
+         tag, str(CACHE_VERSION), __version__]
+        + [repr(p) for p in params]
+    )
+    key = hashlib.blake2b(key_source.encode(), digest_size=8).hexdigest()
+    return os.path.join(_cache_dir(), f"{tag}_{key}.npz")
+
+
+def _cache_dir():
+    """Return the directory holding this application's cached arrays."""
+    # CacheLocation is already per application once an application name is
+    # set; the subdirectory keeps entries apart when it is not
+    app_cache = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    return os.path.join(app_cache, "eeg_viewer_arrays")
+
+
+def load_arrays(path):
+    """Return the dict of arrays stored at path, or None on a miss."""
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+        # Mark the entry as recently used so pruning removes it last
+        os.utime(path)
+        return arrays
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        return None
+
+
+def save_arrays(path, **arrays):
+    """Store arrays at path. Failures are ignored; the cache is optional."""
+    if path is None:
+        return
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so a reader never sees a half-written entry
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        _prune(os.path.dirname(path))
+    except OSError:
+        pass
+
+
+def _prune(cache_dir):
+    """Delete expired entries, then the least recently used over the size cap."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(".npz"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort(reverse=True)  # most recently used first
+
+    expiry = time.time() - CACHE_MAX_AGE_DAYS * 86400
+    total = 0
+    for mtime, size, path in entries:
+        total += size
+        if mtime < expiry or total > CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
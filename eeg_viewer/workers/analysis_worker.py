@@ -1,27 +1,35 @@
-"""Background thread worker for qEEG analysis."""
+"""Background worker for qEEG analysis."""
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class AnalysisWorker(QObject):
-    """Runs qEEG analysis in a background QThread."""
+class AnalysisRunnable(QRunnable):
+    """Runs qEEG analysis on a QThreadPool thread.
 
-    progress = pyqtSignal(int, str)  # (percentage, status message)
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
+    QRunnable cannot emit signals itself, so they live on the small
+    ``signals`` QObject. ``finished`` carries the analyzer, which lets the
+    receiver ignore a run that has since been superseded.
+    """
+
+    class Signals(QObject):
+        progress = pyqtSignal(int, str)  # (percentage, status message)
+        finished = pyqtSignal(object)  # the analyzer that was run
+        error = pyqtSignal(str)
 
     def __init__(self, analyzer):
         super().__init__()
         self._analyzer = analyzer
+        self.signals = self.Signals()
 
     def run(self):
         """Execute the full analysis pipeline."""
         try:
-            self._analyzer.set_progress_callback(self._on_progress)
+            # Emit directly rather than through a method of self: the analyzer
+            # holding a reference back to this runnable would form a cycle that
+            # the garbage collector may break while the pool still runs it
+            self._analyzer.set_progress_callback(self.signals.progress.emit)
             self._analyzer.run_full_analysis()
-            self.finished.emit()
+            self.signals.finished.emit(self._analyzer)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
-    def _on_progress(self, percent, message):
-        self.progress.emit(percent, message)
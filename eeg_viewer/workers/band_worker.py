@@ -0,0 +1,75 @@
+"""Background thread worker for the band view's GFP traces and spectrogram."""
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from ..utils.array_cache import cache_path, load_arrays, save_arrays
+from ..utils.constants import FREQ_BANDS
+
+
+class BandComputeWorker(QObject):
+    """Computes band GFP traces and the GFP spectrogram in a background QThread.
+
+    Results are reloaded from the on-disk cache when the same recording was
+    processed before.
+    """
+
+    finished = pyqtSignal(object)  # dict of arrays, see _compute()
+    error = pyqtSignal(str)
+
+    def __init__(self, loader, processor, spectrogram_f_max):
+        super().__init__()
+        self._loader = loader
+        self._processor = processor
+        self._f_max = spectrogram_f_max
+
+    def run(self):
+        """Load or compute the band view arrays."""
+        try:
+            eeg_channels = self._loader.get_eeg_channels()
+            cache_file = cache_path(
+                self._loader.file_path, "band_view", self._loader.sfreq,
+                eeg_channels, FREQ_BANDS, self._f_max,
+            )
+            arrays = load_arrays(cache_file)
+            if arrays is None:
+                arrays = self._compute(eeg_channels)
+                save_arrays(cache_file, **arrays)
+            self.finished.emit(arrays)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def _compute(self, eeg_channels):
+        """Compute per-band GFP traces and the GFP spectrogram.
+
+        Returns:
+            Dict with "gfp" (n_bands, n_samples) in µV and the spectrogram
+            as "spec_t", "spec_f" and "spec_db".
+        """
+        data = self._loader.get_all_data(eeg_channels)
+
+        # Single precision is ample for display traces and halves the memory
+        # traffic through the filters, the GFP reductions and the spectrogram
+        data = np.ascontiguousarray(data, dtype=np.float32)
+
+        # Bandpass filter and compute GFP (std across channels) for each band.
+        # Simple averaging cancels out because of average-referencing, so we use
+        # Global Field Power = std across channels, which measures activation.
+        # All bands are filtered from one shared FFT of the recording and each
+        # is reduced to its GFP right away, so only one filtered band is alive.
+        gfp = self._processor.band_gfp(data, FREQ_BANDS.values())
+        # GFP in µV
+        gfp *= 1e6
+
+        # Compute spectrogram on GFP signal (std across channels, not mean)
+        gfp_signal = self._processor.global_field_power(data)
+        # Only the displayed rows are kept, which also keeps the color limits
+        # and the image to what is actually on screen
+        f, t, Sxx = self._processor.compute_spectrogram(
+            gfp_signal, nperseg=256, noverlap=192, f_max=self._f_max,
+        )
+        # Display-only data: single precision is plenty and halves what the
+        # image resampler has to stream through
+        Sxx_db = (10 * np.log10(Sxx + 1e-20)).astype(np.float32)
+
+        return {"gfp": gfp, "spec_t": t, "spec_f": f, "spec_db": Sxx_db}
@@ -1,6 +1,6 @@
 """QTimer-driven playback controller for waveform animation."""
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtCore import QObject, QElapsedTimer, QTimer, pyqtSignal
 
 from ..utils.constants import TARGET_FPS, DEFAULT_SPEED
 
@@ -10,6 +10,8 @@ class PlaybackWorker(QObject):
 
     Uses QTimer rather than QThread because GUI updates must happen on the
     main thread, and the per-frame data slicing is fast (numpy array views).
+    Time advances by the wall-clock time between ticks, so playback keeps
+    its speed even when slow frames make the timer skip ticks.
     """
 
     time_updated = pyqtSignal(float)  # current time in seconds
@@ -19,6 +21,7 @@ class PlaybackWorker(QObject):
         super().__init__(parent)
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._tick)
+        self._clock = QElapsedTimer()
         self._fps = TARGET_FPS
         self._speed = DEFAULT_SPEED
         self._current_time = 0.0
@@ -43,6 +46,7 @@ class PlaybackWorker(QObject):
             return
         self._is_playing = True
         interval_ms = int(1000 / self._fps)
+        self._clock.start()
         self._timer.start(interval_ms)
 
     def pause(self):
@@ -66,9 +70,9 @@ class PlaybackWorker(QObject):
         self.time_updated.emit(self._current_time)
 
     def _tick(self):
-        """Advance time by one frame step."""
-        step = self._speed / self._fps
-        self._current_time += step
+        """Advance time by the elapsed wall-clock time since the last tick."""
+        elapsed_sec = self._clock.restart() / 1000.0
+        self._current_time += self._speed * elapsed_sec
 
         if self._current_time >= self._duration:
             self._current_time = self._duration
@@ -16,6 +16,10 @@ PSD_NPERSEG = 1024
 PSD_NOVERLAP = 512
 PSD_WINDOW = "hann"
 
+# Band GFP traces are computed at about this rate (Hz), well above twice the
+# highest band edge
+GFP_PLOT_SFREQ = 100.0
+
 # Z-score colormap range
 ZSCORE_VMIN = -2.5
 ZSCORE_VMAX = 2.5
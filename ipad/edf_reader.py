@@ -14,6 +14,33 @@ import numpy as np
 # Old 10-20 nomenclature to new (ACNS 2006 standard)
 OLD_TO_NEW = {"T3": "T7", "T4": "T8", "T5": "P7", "T6": "P8"}
 
+# Channel header fields and their widths in bytes, in file order
+_CHANNEL_FIELDS = (
+    ("label", 16),
+    ("transducer", 80),
+    ("phys_dim", 8),
+    ("phys_min", 8),
+    ("phys_max", 8),
+    ("dig_min", 8),
+    ("dig_max", 8),
+    ("prefilter", 80),
+    ("samples_per_record", 8),
+    ("reserved", 32),
+)
+
+
+def _split_fields(block, n_channels, layout):
+    """Slice a channel header block into {field: [stripped bytes per channel]}."""
+    fields = {}
+    pos = 0
+    for name, width in layout:
+        fields[name] = [
+            block[start:start + width].strip()
+            for start in range(pos, pos + width * n_channels, width)
+        ]
+        pos += width * n_channels
+    return fields
+
 
 def read_edf(file_path):
     """Read an EDF file and return channel data, names, and sample rate.
@@ -23,7 +50,7 @@ def read_edf(file_path):
 
     Returns:
         dict with keys:
-            'data': np.ndarray of shape (n_channels, n_samples) in Volts
+            'data': float32 np.ndarray of shape (n_channels, n_samples) in Volts
             'channel_names': list of channel name strings
             'sfreq': sampling frequency in Hz
             'duration': total duration in seconds
@@ -32,65 +59,70 @@ def read_edf(file_path):
     """
     with open(file_path, "rb") as f:
         # --- HEADER (256 bytes) ---
-        version = f.read(8).decode("ascii").strip()
-        patient_id = f.read(80).decode("ascii").strip()
-        recording_id = f.read(80).decode("ascii").strip()
-        start_date = f.read(8).decode("ascii").strip()
-        start_time = f.read(8).decode("ascii").strip()
-        header_bytes = int(f.read(8).decode("ascii").strip())
-        reserved = f.read(44).decode("ascii").strip()
-        n_data_records = int(f.read(8).decode("ascii").strip())
-        record_duration = float(f.read(8).decode("ascii").strip())
-        n_channels = int(f.read(4).decode("ascii").strip())
+        # int() and float() parse bytes directly, so numeric fields are only
+        # stripped; text is decoded just for the values that are returned
+        header = f.read(256)
+        version = header[0:8].decode("ascii").strip()
+        patient_id = header[8:88].decode("ascii").strip()
+        recording_id = header[88:168].decode("ascii").strip()
+        start_date = header[168:176].decode("ascii").strip()
+        start_time = header[176:184].decode("ascii").strip()
+        header_bytes = int(header[184:192])
+        n_data_records = int(header[236:244])
+        record_duration = float(header[244:252])
+        n_channels = int(header[252:256])
 
         # --- CHANNEL HEADERS (256 bytes per channel) ---
-        labels = [f.read(16).decode("ascii").strip() for _ in range(n_channels)]
-        transducers = [f.read(80).decode("ascii").strip() for _ in range(n_channels)]
-        phys_dims = [f.read(8).decode("ascii").strip() for _ in range(n_channels)]
-        phys_mins = [float(f.read(8).decode("ascii").strip()) for _ in range(n_channels)]
-        phys_maxs = [float(f.read(8).decode("ascii").strip()) for _ in range(n_channels)]
-        dig_mins = [float(f.read(8).decode("ascii").strip()) for _ in range(n_channels)]
-        dig_maxs = [float(f.read(8).decode("ascii").strip()) for _ in range(n_channels)]
-        prefilters = [f.read(80).decode("ascii").strip() for _ in range(n_channels)]
-        samples_per_record = [int(f.read(8).decode("ascii").strip()) for _ in range(n_channels)]
-        ch_reserved = [f.read(32).decode("ascii").strip() for _ in range(n_channels)]
+        # Each field is stored for all channels before the next one starts
+        fields = _split_fields(f.read(256 * n_channels), n_channels, _CHANNEL_FIELDS)
+        labels = [raw.decode("ascii") for raw in fields["label"]]
+        phys_dims = [raw.decode("ascii") for raw in fields["phys_dim"]]
+        phys_mins = [float(raw) for raw in fields["phys_min"]]
+        phys_maxs = [float(raw) for raw in fields["phys_max"]]
+        dig_mins = [float(raw) for raw in fields["dig_min"]]
+        dig_maxs = [float(raw) for raw in fields["dig_max"]]
+        samples_per_record = [int(raw) for raw in fields["samples_per_record"]]
 
         # Compute scaling factors: digital -> physical (Volts)
         # physical = (digital - dig_min) / (dig_max - dig_min) * (phys_max - phys_min) + phys_min
-        scales = []
-        offsets = []
+        # EDF physical dimension is usually "uV" for EEG; folding the factor
+        # into the scaling saves a separate pass over the data
+        scales = np.zeros(n_channels)
+        offsets = np.zeros(n_channels)
         for i in range(n_channels):
             dig_range = dig_maxs[i] - dig_mins[i]
             phys_range = phys_maxs[i] - phys_mins[i]
             if dig_range == 0:
-                scales.append(0.0)
-                offsets.append(0.0)
-            else:
-                scale = phys_range / dig_range
-                offset = phys_mins[i] - dig_mins[i] * scale
-                scales.append(scale)
-                offsets.append(offset)
+                continue
+            unit = phys_dims[i].lower().strip()
+            to_volts = 1e-6 if unit in ("uv", "µv", "microvolt", "microvolts") else 1.0
+            scales[i] = phys_range / dig_range
+            offsets[i] = (phys_mins[i] - dig_mins[i] * scales[i]) * to_volts
+            scales[i] *= to_volts
 
         # --- DATA RECORDS ---
         # EDF stores data as interleaved records:
         # [record1_ch1, record1_ch2, ..., record2_ch1, record2_ch2, ...]
-        all_data = []
-        for _ in range(n_data_records):
-            record_channels = []
-            for ch_idx in range(n_channels):
-                n_samps = samples_per_record[ch_idx]
-                raw_bytes = f.read(n_samps * 2)  # 16-bit integers
-                digital = np.frombuffer(raw_bytes, dtype="<i2")
-                # Convert to physical units
-                physical = digital.astype(np.float64) * scales[ch_idx] + offsets[ch_idx]
-                record_channels.append(physical)
-            all_data.append(record_channels)
-
-    # Concatenate records for each channel
-    data = np.zeros((n_channels, n_data_records * samples_per_record[0]))
-    for ch_idx in range(n_channels):
-        segments = [all_data[rec][ch_idx] for rec in range(n_data_records)]
-        data[ch_idx] = np.concatenate(segments)
+        n_samps = samples_per_record[0]
+        if any(n != n_samps for n in samples_per_record):
+            raise ValueError("EDF channels with different sample rates are not supported")
+        data_start = f.tell()
+
+    # The 16-bit samples are memory-mapped rather than read, so the file is
+    # paged straight into the float32 conversion below instead of being held
+    # in memory a second time as a bytes copy
+    digital = np.memmap(
+        file_path, dtype="<i2", mode="r", offset=data_start,
+        shape=(n_data_records, n_channels, n_samps),
+    )
+
+    # Reorder records into one contiguous row per channel; the scaling writes
+    # the float32 result directly, so reordering, conversion and scaling
+    # share one pass, and the offsets are added in place
+    data = np.empty((n_channels, n_data_records, n_samps), dtype=np.float32)
+    np.multiply(digital.transpose(1, 0, 2), scales[:, None, None], out=data)
+    data = data.reshape(n_channels, n_data_records * n_samps)
+    data += offsets[:, None]
 
     # Clean up channel names: strip "EEG " prefix, rename old nomenclature
     clean_names = []
@@ -105,13 +137,6 @@ def read_edf(file_path):
         name = OLD_TO_NEW.get(name, name)
         clean_names.append(name)
 
-    # Convert physical units to Volts if needed
-    # EDF physical dimension is usually "uV" for EEG
-    for i in range(n_channels):
-        unit = phys_dims[i].lower().strip()
-        if unit in ("uv", "µv", "microvolt", "microvolts"):
-            data[i] *= 1e-6  # Convert µV to V
-
     sfreq = samples_per_record[0] / record_duration
     duration = n_data_records * record_duration
 
@@ -20,18 +20,19 @@ import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
-from scipy.signal import spectrogram as scipy_spectrogram
+from matplotlib.collections import LineCollection
+from scipy.signal import decimate
 
 from edf_reader import read_edf
 from topomap import plot_topomap, ZSCORE_CMAP
 from signal_processing import (
-    compute_psd, compute_band_power, compute_relative_power,
-    bandpass_filter, highpass_filter, average_reference,
-    reject_artifacts, compute_zscores_within,
+    compute_psd, compute_all_band_powers,
+    band_gfp, highpass_filter, average_reference,
+    reject_artifacts, compute_zscores_within, compute_spectrogram,
 )
 from constants import (
     FREQ_BANDS, STANDARD_1020_CHANNELS, REGION_MAP, ZSCORE_VMIN, ZSCORE_VMAX,
-    BAND_SHADING,
+    BAND_SHADING, TOTAL_POWER_RANGE, GFP_PLOT_SFREQ,
 )
 
 
@@ -53,7 +54,8 @@ def preprocess(edf):
     """Preprocess EDF data: select EEG channels, average reference, filter.
 
     Returns:
-        (eeg_data, eeg_channels, sfreq) — data in Volts, average-referenced, 1Hz HP filtered.
+        (eeg_data, eeg_channels, sfreq) — float32 data in Volts, average-referenced,
+        1Hz HP filtered. Single precision is kept through the whole analysis.
     """
     # Identify EEG channels (exclude ECG/EKG)
     eeg_indices = []
@@ -63,11 +65,17 @@ def preprocess(edf):
             eeg_indices.append(i)
             eeg_channels.append(ch)
 
-    eeg_data = edf["data"][eeg_indices]
     sfreq = edf["sfreq"]
 
-    # Average reference (matches clinical qEEG preprocessing)
-    eeg_data = average_reference(eeg_data)
+    # Average reference (matches clinical qEEG preprocessing). edf["data"] is
+    # left intact: a contiguous run of channels is sliced as a view and
+    # referenced into a new array, so the subtraction is the only copy;
+    # otherwise fancy indexing copies and the referencing is done in place
+    if eeg_indices and eeg_indices == list(range(eeg_indices[0], eeg_indices[-1] + 1)):
+        block = edf["data"][eeg_indices[0]:eeg_indices[-1] + 1]
+        eeg_data = average_reference(block, out=np.empty_like(block))
+    else:
+        eeg_data = average_reference(edf["data"][eeg_indices])
 
     # 1 Hz high-pass filter (removes DC drift, eye-blink artifacts)
     eeg_data = highpass_filter(eeg_data, sfreq, cutoff=1.0)
@@ -86,16 +94,18 @@ def run_analysis(eeg_data, eeg_channels, sfreq):
     print(f"  -> {artifact_stats['clean']}/{artifact_stats['total']} epochs clean ({pct:.1f}% rejected)")
 
     print("  Computing PSD...")
-    freqs, psd = compute_psd(clean_data, sfreq)
+    # Band powers and the spectra plots only use bins up to 25 Hz. The data is
+    # already 1 Hz high-passed, so the per-segment mean removal is skipped
+    f_max = max([TOTAL_POWER_RANGE[1]] + [f_high for _, f_high in FREQ_BANDS.values()])
+    freqs, psd = compute_psd(clean_data, sfreq, f_max=f_max, detrend=False)
 
     print("  Computing band powers and Z-scores...")
-    band_powers = {}
-    relative_powers = {}
-    zscores = {}
-    for band_name, band_range in FREQ_BANDS.items():
-        band_powers[band_name] = compute_band_power(psd, freqs, band_range)
-        relative_powers[band_name] = compute_relative_power(psd, freqs, band_range)
-        zscores[band_name] = compute_zscores_within(relative_powers[band_name])
+    band_powers, relative_powers = compute_all_band_powers(psd, freqs)
+    # All bands are scored in one call on the (n_bands, n_channels) stack
+    band_zscores = compute_zscores_within(
+        np.stack([relative_powers[band_name] for band_name in FREQ_BANDS])
+    )
+    zscores = dict(zip(FREQ_BANDS, band_zscores))
 
     return {
         "freqs": freqs,
@@ -116,6 +126,9 @@ def plot_magnitude_spectra(results, axes):
     psd = results["psd"]
     channels = results["eeg_channels"]
 
+    freq_mask = (freqs >= 1) & (freqs <= 25)
+    f = freqs[freq_mask]
+
     regions = ["Frontal", "Central", "Posterior"]
     for col, region in enumerate(regions):
         ax = axes[col]
@@ -124,25 +137,25 @@ def plot_magnitude_spectra(results, axes):
         if not indices:
             continue
 
-        region_psd = np.mean(psd[indices], axis=0)
-        amplitude = np.sqrt(region_psd) * 1e6  # µV
-
-        freq_mask = (freqs >= 1) & (freqs <= 25)
-        f = freqs[freq_mask]
-        a = amplitude[freq_mask]
+        region_psd = np.mean(psd[indices][:, freq_mask], axis=0)
+        a = np.sqrt(region_psd) * 1e6  # µV
 
         # Band shading
         for band_name, shade_color in BAND_SHADING.items():
             f_low, f_high = FREQ_BANDS[band_name]
             ax.axvspan(f_low, f_high, alpha=0.3, color=shade_color)
 
-        # Band boundaries
-        for boundary in [4, 8, 13]:
-            ax.axvline(boundary, color="gray", linewidth=0.8, linestyle="--", alpha=0.5)
-
-        # 1 Hz gridlines
-        for hz in range(1, 26):
-            ax.axvline(hz, color="#E0E0E0", linewidth=0.3, alpha=0.5)
+        # Band boundaries and 1 Hz gridlines, each drawn as a single
+        # collection of full-height lines like axvline() makes
+        full_height = ax.get_xaxis_transform()
+        ax.add_collection(LineCollection(
+            [[(hz, 0), (hz, 1)] for hz in [4, 8, 13]], transform=full_height,
+            colors="gray", linewidths=0.8, linestyles="--", alpha=0.5,
+        ), autolim=False)
+        ax.add_collection(LineCollection(
+            [[(hz, 0), (hz, 1)] for hz in range(1, 26)], transform=full_height,
+            colors="#E0E0E0", linewidths=0.3, alpha=0.5,
+        ), autolim=False)
 
         ax.plot(f, a, color="#1a1a2e", linewidth=1.2)
         ax.fill_between(f, 0, a, alpha=0.15, color="#1a1a2e")
@@ -188,18 +201,24 @@ def plot_topomaps(results, axes):
 def plot_band_gfp(eeg_data, sfreq, ax):
     """Plot Global Field Power traces for each band."""
     colors = {"Delta": "#6A0DAD", "Theta": "#228B22", "Alpha": "#DAA520", "Beta": "#CC3333"}
+
+    # The bands end well below 50 Hz, so the recording is decimated to about
+    # GFP_PLOT_SFREQ before filtering rather than thinned after it
+    q = max(1, int(sfreq // GFP_PLOT_SFREQ))
+    if q > 1:
+        eeg_data = decimate(eeg_data, q, axis=1, zero_phase=True)
+    plot_sfreq = sfreq / q
     n_samples = eeg_data.shape[1]
-    times = np.arange(n_samples) / sfreq
 
-    # Downsample for plotting
+    # Thin long recordings further for plotting
     max_pts = 20000
     step = max(1, n_samples // max_pts)
-    t_ds = times[::step]
+    t_ds = np.arange(0, n_samples, step) / plot_sfreq
 
-    for band_name, (f_low, f_high) in FREQ_BANDS.items():
-        filtered = bandpass_filter(eeg_data, sfreq, f_low, f_high)
-        gfp = np.std(filtered, axis=0) * 1e6  # µV
-        gfp_ds = gfp[::step]
+    # All bands come from one shared FFT of the recording
+    gfp = band_gfp(eeg_data, plot_sfreq, FREQ_BANDS.values()) * 1e6  # µV
+    for band_idx, band_name in enumerate(FREQ_BANDS):
+        gfp_ds = gfp[band_idx, ::step]
         ax.plot(t_ds, gfp_ds, label=band_name, color=colors[band_name], linewidth=0.8, alpha=0.8)
 
     ax.set_xlabel("Time (s)", fontsize=10)
@@ -213,18 +232,25 @@ def plot_spectrogram(eeg_data, sfreq, ax):
     """Plot global GFP spectrogram."""
     gfp_signal = np.std(eeg_data, axis=0)
 
-    f, t, Sxx = scipy_spectrogram(
-        gfp_signal, fs=sfreq, window="hann", nperseg=256, noverlap=192, scaling="density",
-    )
-    Sxx_db = 10 * np.log10(Sxx + 1e-20)
-
+    f, t, Sxx = compute_spectrogram(gfp_signal, sfreq, nperseg=256, noverlap=192)
+    # Convert to dB in place
+    Sxx += 1e-20
+    Sxx_db = np.log10(Sxx, out=Sxx)
+    Sxx_db *= 10
+    vmin, vmax = np.percentile(Sxx_db, [5, 95])
+
+    # Only the rows up to the first bin at or above f_max are visible; the
+    # color limits above still come from the full spectrogram. The mesh is
+    # rasterized so vector output embeds one image instead of every cell
+    f_max = 30
+    n_rows = min(len(f), np.searchsorted(f, f_max) + 1)
     im = ax.pcolormesh(
-        t, f, Sxx_db, shading="gouraud", cmap="viridis",
-        vmin=np.percentile(Sxx_db, 5), vmax=np.percentile(Sxx_db, 95),
+        t, f[:n_rows], Sxx_db[:n_rows], shading="gouraud", cmap="viridis",
+        vmin=vmin, vmax=vmax, rasterized=True,
     )
     for boundary in [1, 4, 8, 13, 25]:
         ax.axhline(boundary, color="white", linewidth=0.5, linestyle="--", alpha=0.5)
-    ax.set_ylim(0, 30)
+    ax.set_ylim(0, f_max)
     ax.set_xlabel("Time (s)", fontsize=10)
     ax.set_ylabel("Frequency (Hz)", fontsize=10)
     ax.set_title("Global Field Power Spectrogram", fontsize=11, fontweight="bold")
@@ -5,7 +5,9 @@ only flat-file imports compatible with Pyto on iPad.
 """
 
 import numpy as np
-from scipy.signal import welch, butter, filtfilt, coherence
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import welch, butter, sosfiltfilt, sosfreqz, coherence, get_window
+from scipy.fft import rfft, irfft, rfftfreq, next_fast_len, set_workers
 from scipy.integrate import simpson
 
 from constants import (
@@ -13,54 +15,164 @@ from constants import (
     EPOCH_DURATION_SEC, ARTIFACT_THRESHOLD_UV, MIN_CLEAN_EPOCHS,
 )
 
+# Reflection padding of the FFT band filters, in periods of the lowest cutoff
+FFT_PAD_CYCLES = 6
 
-def compute_psd(data, sfreq):
+
+def compute_psd(data, sfreq, f_max=None, detrend="constant"):
     """Compute PSD using Welch's method.
 
+    Args:
+        f_max: If given, only bins up to f_max (inclusive) are returned.
+        detrend: Per-segment detrend passed to welch(); False skips it for
+            data that is already high-pass filtered.
+
     Returns:
         (freqs, psd) where psd shape is (n_channels, n_freqs).
     """
-    return welch(
-        data, fs=sfreq, nperseg=PSD_NPERSEG, noverlap=PSD_NOVERLAP,
-        window=PSD_WINDOW, detrend="constant", axis=-1,
-    )
+    # Let scipy.fft spread the segment FFTs over all cores
+    with set_workers(-1):
+        freqs, psd = welch(
+            data, fs=sfreq, nperseg=PSD_NPERSEG, noverlap=PSD_NOVERLAP,
+            window=PSD_WINDOW, detrend=detrend, axis=-1,
+        )
+    if f_max is not None:
+        n_keep = np.searchsorted(freqs, f_max, side="right")
+        # Copy so the full spectrum can be freed
+        freqs, psd = freqs[:n_keep].copy(), psd[:, :n_keep].copy()
+    return freqs, psd
+
+
+def band_slice(freqs, band):
+    """Slice of the sorted freqs within band (inclusive), found by binary search."""
+    f_low, f_high = band
+    lo = np.searchsorted(freqs, f_low, side="left")
+    hi = np.searchsorted(freqs, f_high, side="right")
+    return slice(lo, max(lo, hi))
 
 
-def compute_band_power(psd, freqs, band):
-    """Absolute band power via Simpson integration."""
-    f_low, f_high = band
-    mask = (freqs >= f_low) & (freqs <= f_high)
-    if not np.any(mask):
-        return np.zeros(psd.shape[0])
-    return simpson(psd[:, mask], x=freqs[mask], axis=1)
+def compute_spectrogram(data, sfreq, nperseg=256, noverlap=None):
+    """Hann-window spectrogram along the last axis.
 
+    Equivalent to scipy.signal.spectrogram with window="hann" (constant
+    detrend, one-sided density scaling), but the segments are framed as one
+    strided view and transformed in a single multithreaded rfft.
 
-def compute_relative_power(psd, freqs, band):
-    """Relative band power = band / total."""
-    band_power = compute_band_power(psd, freqs, band)
-    total_power = compute_band_power(psd, freqs, TOTAL_POWER_RANGE)
-    total_power = np.where(total_power > 0, total_power, 1e-10)
-    return band_power / total_power
+    Returns:
+        (freqs, times, Sxx) where Sxx has shape (..., n_freqs, n_segments).
+    """
+    nperseg = min(nperseg, data.shape[-1])
+    if noverlap is None:
+        noverlap = nperseg // 8
+    step = nperseg - noverlap
+
+    dtype = np.result_type(data.dtype, np.float32)
+    window = get_window("hann", nperseg).astype(dtype)
+    segments = sliding_window_view(data, nperseg, axis=-1)[..., ::step, :].astype(dtype)
+    segments -= segments.mean(axis=-1, keepdims=True)
+    segments *= window
+    spectra = rfft(segments, axis=-1, workers=-1)
+
+    # One-sided power spectral density; the Nyquist bin of an even-length
+    # segment is not doubled
+    Sxx = np.abs(spectra) ** 2
+    Sxx *= 1.0 / (sfreq * np.sum(window.astype(np.float64) ** 2))
+    if nperseg % 2:
+        Sxx[..., 1:] *= 2
+    else:
+        Sxx[..., 1:-1] *= 2
+
+    freqs = rfftfreq(nperseg, d=1.0 / sfreq)
+    times = (np.arange(Sxx.shape[-2]) * step + nperseg / 2) / sfreq
+    return freqs, times, np.swapaxes(Sxx, -1, -2)
+
+
+def band_integration_weights(freqs, bands):
+    """Simpson weights per band, shape (n_bands, n_freqs): weights @ psd.T integrates all bands."""
+    weights = np.zeros((len(bands), len(freqs)))
+    for row, band in enumerate(bands):
+        band_bins = band_slice(freqs, band)
+        n_bins = band_bins.stop - band_bins.start
+        if n_bins:
+            weights[row, band_bins] = simpson(np.eye(n_bins), x=freqs[band_bins], axis=1)
+    return weights
+
+
+def compute_all_band_powers(psd, freqs):
+    """Absolute and relative power for every band in FREQ_BANDS.
+
+    All bands and the total-power range are integrated in one matrix product.
+
+    Returns:
+        (band_powers, relative_powers) dicts of band name -> (n_channels,).
+    """
+    ranges = list(FREQ_BANDS.values()) + [TOTAL_POWER_RANGE]
+    powers = band_integration_weights(freqs, ranges) @ psd.T  # (n_bands + 1, n_channels)
+    total_power = np.where(powers[-1] > 0, powers[-1], 1e-10)
+    band_powers = {}
+    relative_powers = {}
+    for band_idx, band_name in enumerate(FREQ_BANDS):
+        band_powers[band_name] = powers[band_idx]
+        relative_powers[band_name] = powers[band_idx] / total_power
+    return band_powers, relative_powers
 
 
-def bandpass_filter(data, sfreq, low, high, order=4):
-    """Apply bandpass Butterworth filter."""
+def band_gfp(data, sfreq, bands, order=4):
+    """Global Field Power (std across channels) of each bandpassed band.
+
+    All bands are filtered from one shared rfft: each applies the squared
+    Butterworth magnitude, the zero-phase response of sosfiltfilt().
+    The record is odd-reflected over FFT_PAD_CYCLES periods of the lowest
+    cutoff so the circular filter does not wrap one end into the other.
+
+    Returns:
+        Array of shape (n_bands, n_samples).
+    """
+    bands = list(bands)
     nyquist = sfreq / 2
-    b, a = butter(order, [low / nyquist, high / nyquist], btype="band")
-    return filtfilt(b, a, data, axis=-1)
+    n_samples = data.shape[-1]
+
+    lowest = min(low for low, _ in bands)
+    pad = min(n_samples - 1, int(np.ceil(FFT_PAD_CYCLES * sfreq / lowest)))
+    if pad > 0:
+        data = np.concatenate([
+            2 * data[:, :1] - data[:, pad:0:-1],
+            data,
+            2 * data[:, -1:] - data[:, -2:-pad - 2:-1],
+        ], axis=-1)
+    n_fft = next_fast_len(data.shape[-1], real=True)
+    # Single precision is plenty for display traces and halves the FFT work
+    spectrum = rfft(data.astype(np.float32), n=n_fft, axis=-1, workers=-1)
+    freqs = rfftfreq(n_fft, d=1.0 / sfreq)
+
+    gfp = np.empty((len(bands), n_samples), dtype=np.float32)
+    for band_idx, (low, high) in enumerate(bands):
+        sos = butter(order, [low / nyquist, high / nyquist], btype="band", output="sos")
+        _, h = sosfreqz(sos, worN=freqs, fs=sfreq)
+        gain = (np.abs(h) ** 2).astype(np.float32)
+        filtered = irfft(spectrum * gain, n=n_fft, axis=-1, workers=-1)
+        gfp[band_idx] = np.std(filtered[:, pad:pad + n_samples], axis=0)
+    return gfp
 
 
 def highpass_filter(data, sfreq, cutoff=1.0, order=4):
-    """Apply high-pass Butterworth filter."""
+    """Apply high-pass Butterworth filter. float32 input stays float32."""
     nyquist = sfreq / 2
-    b, a = butter(order, cutoff / nyquist, btype="high")
-    return filtfilt(b, a, data, axis=-1)
+    sos = butter(order, cutoff / nyquist, btype="high", output="sos")
+    sos = sos.astype(np.result_type(data.dtype, np.float32), copy=False)
+    return sosfiltfilt(sos, data, axis=-1)
 
 
-def average_reference(data):
-    """Apply average reference: subtract mean across channels at each time point."""
-    mean_signal = np.mean(data, axis=0, keepdims=True)
-    return data - mean_signal
+def average_reference(data, out=None):
+    """Apply average reference: subtract mean across channels at each time point.
+
+    Works in place on data (which is also returned) unless out is given, so
+    no second copy of the recording is allocated. With out, data is left
+    untouched and the result is written there in the same single pass.
+    """
+    if out is None:
+        out = data
+    return np.subtract(data, data.mean(axis=0), out=out)
 
 
 def reject_artifacts(data, sfreq, threshold_uv=None, epoch_sec=None):
@@ -77,48 +189,40 @@ def reject_artifacts(data, sfreq, threshold_uv=None, epoch_sec=None):
     if n_epochs == 0:
         return data, {"total": 0, "clean": 0, "rejected": 0, "threshold": threshold}
 
-    clean_epochs = []
-    for e in range(n_epochs):
-        start = e * epoch_samples
-        end = start + epoch_samples
-        epoch = data[:, start:end]
-        ptp_uv = (np.max(epoch, axis=1) - np.min(epoch, axis=1)) * 1e6
-        if np.all(ptp_uv <= threshold):
-            clean_epochs.append(epoch)
+    # Peak-to-peak in µV for every channel and epoch, computed once; an epoch
+    # is rejected if ANY channel exceeds the threshold
+    n_channels = data.shape[0]
+    epochs = data[:, :n_epochs * epoch_samples].reshape(n_channels, n_epochs, epoch_samples)
+    worst_ptp_uv = np.ptp(epochs, axis=2).max(axis=0) * 1e6
 
     # Progressively relax if too few clean epochs
-    if len(clean_epochs) < MIN_CLEAN_EPOCHS:
-        for relaxed in [150, 200, 300, 500]:
-            clean_epochs = []
-            for e in range(n_epochs):
-                start = e * epoch_samples
-                end = start + epoch_samples
-                epoch = data[:, start:end]
-                ptp_uv = (np.max(epoch, axis=1) - np.min(epoch, axis=1)) * 1e6
-                if np.all(ptp_uv <= relaxed):
-                    clean_epochs.append(epoch)
-            threshold = relaxed
-            if len(clean_epochs) >= MIN_CLEAN_EPOCHS:
-                break
-
-    if len(clean_epochs) < MIN_CLEAN_EPOCHS:
+    for threshold in [threshold, 150, 200, 300, 500]:
+        keep = worst_ptp_uv <= threshold
+        n_clean = int(np.count_nonzero(keep))
+        if n_clean >= MIN_CLEAN_EPOCHS:
+            break
+    else:
         stats = {"total": n_epochs, "clean": n_epochs, "rejected": 0, "threshold": float("inf")}
         return data, stats
 
-    clean_data = np.concatenate(clean_epochs, axis=1)
+    # compress() copies whole epochs; boolean indexing is much slower here
+    clean_data = np.compress(keep, epochs, axis=1).reshape(n_channels, -1)
     stats = {
         "total": n_epochs,
-        "clean": len(clean_epochs),
-        "rejected": n_epochs - len(clean_epochs),
+        "clean": n_clean,
+        "rejected": n_epochs - n_clean,
         "threshold": threshold,
     }
     return clean_data, stats
 
 
 def compute_zscores_within(channel_values):
-    """Within-subject Z-scores."""
-    mean = np.mean(channel_values)
-    std = np.std(channel_values, ddof=1)
-    if std < 1e-10:
-        return np.zeros_like(channel_values)
-    return (channel_values - mean) / std
+    """Within-subject Z-scores along the last axis.
+
+    Accepts one (n_channels,) vector or an (n_bands, n_channels) stack, so all
+    bands can be scored in one call. Rows with no spread map to zeros.
+    """
+    mean = np.mean(channel_values, axis=-1, keepdims=True)
+    std = np.std(channel_values, axis=-1, ddof=1, keepdims=True)
+    flat = std < 1e-10
+    return np.where(flat, 0.0, (channel_values - mean) / np.where(flat, 1.0, std))
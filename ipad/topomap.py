@@ -5,8 +5,11 @@ CloughTocher2DInterpolator for smooth interpolation and matplotlib
 for rendering — the same approach MNE uses internally.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay
 from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.patches import Circle
 import matplotlib.pyplot as plt
@@ -76,6 +79,36 @@ def get_channel_positions(channel_names):
     return np.array(positions)
 
 
+@lru_cache(maxsize=4)
+def _topomap_grid(channel_names, resolution):
+    """Geometry shared by every map of one montage, keyed by channel-name tuple.
+
+    Returns:
+        (tri, center, head_radius, grid_x, grid_y, outside) — the electrode
+        triangulation, head circle center, grid axes and the mask of grid
+        points outside the head.
+    """
+    pos = get_channel_positions(channel_names)
+    x, y = pos[:, 0], pos[:, 1]
+
+    # Determine head radius from electrode positions
+    center_x = np.mean(x)
+    center_y = np.mean(y)
+    max_dist = np.max(np.sqrt((x - center_x)**2 + (y - center_y)**2))
+    head_radius = max_dist * 1.15  # Slightly larger than outermost electrode
+
+    # Create interpolation grid
+    grid_x = np.linspace(center_x - head_radius, center_x + head_radius, resolution)
+    grid_y = np.linspace(center_y - head_radius, center_y + head_radius, resolution)
+    grid_xx, grid_yy = np.meshgrid(grid_x, grid_y)
+
+    # Mask outside the head circle
+    dist_from_center = np.sqrt((grid_xx - center_x)**2 + (grid_yy - center_y)**2)
+    outside = dist_from_center > head_radius
+
+    return Delaunay(pos), (center_x, center_y), head_radius, grid_x, grid_y, outside
+
+
 def plot_topomap(data, channel_names, ax=None, cmap=None, vmin=-2.5, vmax=2.5,
                  resolution=100, show_head=True, show_sensors=False, contours=0):
     """Plot a topographic map of scalp data.
@@ -99,28 +132,16 @@ def plot_topomap(data, channel_names, ax=None, cmap=None, vmin=-2.5, vmax=2.5,
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=(4, 4))
 
-    pos = get_channel_positions(channel_names)
-    x, y = pos[:, 0], pos[:, 1]
-
-    # Determine head radius from electrode positions
-    center_x = np.mean(x)
-    center_y = np.mean(y)
-    max_dist = np.max(np.sqrt((x - center_x)**2 + (y - center_y)**2))
-    head_radius = max_dist * 1.15  # Slightly larger than outermost electrode
-
-    # Create interpolation grid
-    grid_x = np.linspace(center_x - head_radius, center_x + head_radius, resolution)
-    grid_y = np.linspace(center_y - head_radius, center_y + head_radius, resolution)
+    # The triangulation, grid and head mask only depend on the montage
+    tri, (center_x, center_y), head_radius, grid_x, grid_y, outside = _topomap_grid(
+        tuple(channel_names), resolution,
+    )
     grid_xx, grid_yy = np.meshgrid(grid_x, grid_y)
 
     # Interpolate using Clough-Tocher (same as MNE's default 'cubic')
-    interpolator = CloughTocher2DInterpolator(pos, data)
+    interpolator = CloughTocher2DInterpolator(tri, data)
     grid_data = interpolator(grid_xx, grid_yy)
-
-    # Mask outside the head circle
-    dist_from_center = np.sqrt((grid_xx - center_x)**2 + (grid_yy - center_y)**2)
-    mask = dist_from_center > head_radius
-    grid_data[mask] = np.nan
+    grid_data[outside] = np.nan
 
     # Plot interpolated data
     im = ax.imshow(
@@ -147,7 +168,7 @@ def plot_topomap(data, channel_names, ax=None, cmap=None, vmin=-2.5, vmax=2.5,
 
     # Draw sensor dots
     if show_sensors:
-        ax.scatter(x, y, c="black", s=8, zorder=5)
+        ax.scatter(tri.points[:, 0], tri.points[:, 1], c="black", s=8, zorder=5)
 
     ax.set_xlim(center_x - head_radius * 1.3, center_x + head_radius * 1.3)
     ax.set_ylim(center_y - head_radius * 1.3, center_y + head_radius * 1.3)